@@ -5,13 +5,12 @@ Immutable, side-effect-free analysis of energy system telemetry data.
 """
 
 import math
-import statistics
 from dataclasses import dataclass
 from typing import Deque, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerStreamStats:
     """Statistics for a single power stream (immutable)."""
     current: float
@@ -24,7 +23,7 @@ class PowerStreamStats:
     sample_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnergyBalance:
     """Instantaneous energy balance analysis (immutable)."""
     solar_power: float
@@ -43,7 +42,7 @@ class EnergyBalance:
     battery_discharging: bool  # True if battery discharging
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnergyRatios:
     """Energy efficiency and coverage ratios (immutable)."""
     self_consumption_ratio: float  # (P_solar - P_grid_export) / P_solar
@@ -58,7 +57,7 @@ class EnergyRatios:
     battery_active: bool   # Battery charging or discharging
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisSnapshot:
     """Complete immutable analysis snapshot of energy system state."""
     timestamp: datetime
@@ -94,27 +93,25 @@ def _calculate_power_stream_stats(buffer: Deque[float], sample_rate: float) -> P
     data = list(buffer)  # Convert to list for calculations
     sample_count = len(data)
     
-    # Basic statistics
+    # Basic statistics (plain float arithmetic; statistics.mean/stdev do exact
+    # fraction-based accumulation, which is far slower and not needed here)
     current = data[-1]
-    mean = statistics.mean(data)
-    std_dev = statistics.stdev(data) if sample_count > 1 else 0.0
+    mean = sum(data) / sample_count
+    squared_deviation = sum((x - mean) * (x - mean) for x in data)
+    std_dev = math.sqrt(squared_deviation / (sample_count - 1)) if sample_count > 1 else 0.0
     min_value = min(data)
     max_value = max(data)
     
     # First derivative (rate of change)
     first_derivative = 0.0
     if sample_count >= 10:  # Need sufficient samples for stable derivative
-        # Use last 10 points for derivative calculation
+        # Linear regression slope over the last 10 points, x = 0..9
         recent_data = data[-10:]
-        x = list(range(len(recent_data)))
-        y = recent_data
-        n = len(x)
-        
-        # Linear regression slope
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_x2 = sum(x[i] * x[i] for i in range(n))
+        n = len(recent_data)
+        sum_x = n * (n - 1) / 2
+        sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+        sum_y = sum(recent_data)
+        sum_xy = sum(i * y for i, y in enumerate(recent_data))
         
         if n * sum_x2 - sum_x * sum_x != 0:
             slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
@@ -123,7 +120,7 @@ def _calculate_power_stream_stats(buffer: Deque[float], sample_rate: float) -> P
     # Oscillation index: RMS(power - mean) / |mean|
     oscillation_index = 0.0
     if abs(mean) > 1.0:  # Avoid division by very small numbers
-        rms_deviation = math.sqrt(sum((x - mean) ** 2 for x in data) / sample_count)
+        rms_deviation = math.sqrt(squared_deviation / sample_count)
         oscillation_index = rms_deviation / abs(mean)
     
     return PowerStreamStats(
@@ -279,7 +276,7 @@ def analyze(solar_buffer: Deque[float], battery_buffer: Deque[float],
         grid_stats.oscillation_index,
         load_stats.oscillation_index
     ]
-    system_stability_index = statistics.mean(oscillations)
+    system_stability_index = sum(oscillations) / len(oscillations)
     
     return AnalysisSnapshot(
         timestamp=now_ts,
@@ -106,8 +106,8 @@ class LiveEnergyMonitor:
             try:
                 # Consumer loop: Update UI at 5fps
                 while self.running:
-                    # Update Live display with current renderable
-                    live.update(self.get_current_renderable())
+                    # Update Live display with current renderable (one frame write)
+                    live.update(self.get_current_renderable(), refresh=True)
                     
                     # Sleep for UI refresh interval (200ms = 5fps)
                     await asyncio.sleep(self.ui_refresh_interval)
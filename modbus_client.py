@@ -1,16 +1,101 @@
 import yaml
+import asyncio
+import socket
 import struct
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
 from pymodbus.constants import Endian
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 # Note: BinaryPayloadDecoder is deprecated in pymodbus 3.7+, but we'll keep it for compatibility
 import logging
 import time
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Two-register (32-bit) values are decoded by packing the words and unpacking them
+# as one dword. Word swap / little endian is just the byte-swapped pair of formats,
+# so the whole endianness cascade collapses into a table lookup done at load time.
+_WORDS_HIGH_FIRST = struct.Struct('>HH')
+_WORDS_LOW_FIRST = struct.Struct('<HH')
+
+# (data_type, low_word_first) -> (word packer, dword unpacker)
+_DWORD_CODECS = {
+    ('uint32', False): (_WORDS_HIGH_FIRST, struct.Struct('>I')),
+    ('uint32', True): (_WORDS_LOW_FIRST, struct.Struct('<I')),
+    ('int32', False): (_WORDS_HIGH_FIRST, struct.Struct('>i')),
+    ('int32', True): (_WORDS_LOW_FIRST, struct.Struct('<i')),
+    ('float32', False): (_WORDS_HIGH_FIRST, struct.Struct('>f')),
+    ('float32', True): (_WORDS_LOW_FIRST, struct.Struct('<f')),
+}
+
+
+# Per-type decoders, dispatched through _DECODERS by data_type.
+# Word order comes from the register's precomputed '_plan'.
+def _decode_uint16(registers: list, reg_config: dict) -> int:
+    return registers[0]
+
+
+def _decode_int16(registers: list, reg_config: dict) -> int:
+    value = registers[0]
+    return value if value < 32768 else value - 65536
+
+
+def _decode_dword(registers: list, reg_config: dict) -> Union[int, float]:
+    packer, unpacker = reg_config['_plan']['dword']
+    return unpacker.unpack(packer.pack(registers[0], registers[1]))[0]
+
+
+def _decode_string(registers: list, reg_config: dict) -> str:
+    # Characters are stored low byte first within each word, so pack the words
+    # little-endian and cut at the first null in one pass.
+    str_struct = reg_config['_plan']['str_struct']
+    if len(registers) >= str_struct.size // 2:
+        raw = str_struct.pack(*registers[:str_struct.size // 2])
+    else:
+        raw = struct.pack(f'<{len(registers)}H', *registers)
+    return raw.split(b'\x00', 1)[0].decode('ascii', 'replace').strip()
+
+
+def _encode_native(value: Union[int, float], reg_config: dict) -> list:
+    plan = reg_config['_plan']
+    value = float(value) if plan['pm_dtype'] is _PM_DATATYPE.FLOAT32 else int(value)
+    return ModbusTcpClient.convert_to_registers(value, plan['pm_dtype'], word_order=plan['pm_word_order'])
+
+
+# Struct field codes for the types a block codec can unpack in place
+_STRUCT_CODES = {
+    'uint16': 'H',
+    'int16': 'h',
+    'uint32': 'I',
+    'int32': 'i',
+    'float32': 'f',
+}
+
+_DECODERS = {
+    'uint16': _decode_uint16,
+    'int16': _decode_int16,
+    'uint32': _decode_dword,
+    'int32': _decode_dword,
+    'float32': _decode_dword,
+    'string': _decode_string,
+}
+
+# Writes are encoded by pymodbus itself (3.7+). Reads stay on the precompiled
+# structs above: pymodbus' convert_from_registers is pure Python and several
+# times slower per call on the polling path.
+_PM_DATATYPE = getattr(ModbusTcpClient, 'DATATYPE', None)
+# Checked on the class, so decoding does not depend on which client is connected
+_HAS_NATIVE_CODECS = hasattr(ModbusTcpClient, 'convert_from_registers')
+_NATIVE_DATATYPES = {} if _PM_DATATYPE is None else {
+    'uint16': _PM_DATATYPE.UINT16,
+    'int16': _PM_DATATYPE.INT16,
+    'uint32': _PM_DATATYPE.UINT32,
+    'int32': _PM_DATATYPE.INT32,
+    'float32': _PM_DATATYPE.FLOAT32,
+}
+
 
 class SungrowModbusClient:
     """
@@ -18,10 +103,20 @@ class SungrowModbusClient:
     the official Home Assistant Sungrow integration.
     """
     
+    # Control register values
+    _EMS_MODES = {'self_consumption': 0, 'forced': 2, 'external_ems': 3}
+    _BATTERY_CMDS = {'stop': 0xCC, 'charge': 0xAA, 'discharge': 0xBB}
+    _EXPORT_MODE = {True: 0xAA, False: 0x55}
+    
+    # Default freshness (seconds) for the grouped get_*_data readers. Cached values
+    # younger than this are returned without touching the bus.
+    _DEFAULT_TTLS = {'energy': 30.0, 'power': 1.0, 'battery': 2.0, 'system': 1.0}
+    
     def __init__(self, config_file: str = "config.yaml"):
         """Initialize the Sungrow Modbus client."""
         self.config_file = config_file
         self.client = None
+        self.async_client = None
         self.host = None
         self.port = None
         self.slave_id = None
@@ -29,6 +124,12 @@ class SungrowModbusClient:
         self.delay = None
         self.registers = {}
         self.legacy_registers = {}
+        self.block_gap = None
+        self.max_block_size = None
+        self._cache = {}  # register name -> (value, monotonic read time)
+        self.connection_lost = False  # set when the last multi-register read got no answer
+        self.last_read_time = None  # monotonic time of the last successful device read
+        self._block_plans = {}  # tuple of register names -> read blocks
         
         self._load_config()
         
@@ -44,9 +145,12 @@ class SungrowModbusClient:
             self.slave_id = modbus_config.get('slave_id', 1)
             self.timeout = modbus_config.get('timeout', 10)
             self.delay = modbus_config.get('delay', 0.1)
+            self.block_gap = modbus_config.get('block_gap', 8)
+            self.max_block_size = modbus_config.get('max_block_size', 125)
             
             self.registers = config.get('registers', {})
             self.legacy_registers = config.get('legacy_registers', {})
+            self._build_register_plans()
             
             logger.info(f"Loaded configuration: {self.host}:{self.port}, slave_id={self.slave_id}")
             logger.info(f"Loaded {len(self.registers)} registers and {len(self.legacy_registers)} legacy registers")
@@ -64,6 +168,8 @@ class SungrowModbusClient:
             self.client = ModbusTcpClient(host=self.host, port=self.port, timeout=self.timeout)
             connected = self.client.connect()
             if connected:
+                self._set_tcp_nodelay()
+                self._set_tcp_keepalive()
                 logger.info(f"✅ Connected to Sungrow inverter at {self.host}:{self.port}")
                 return True
             else:
@@ -73,11 +179,127 @@ class SungrowModbusClient:
             logger.error(f"❌ Connection error: {e}")
             return False
     
+    def _set_tcp_nodelay(self):
+        """
+        Disable Nagle's algorithm on the Modbus TCP socket.
+        
+        Requests are tiny and strictly request/response, so Nagle plus delayed ACKs
+        can add tens to hundreds of milliseconds per round-trip. pymodbus does not
+        set TCP_NODELAY itself (the Modbus TCP spec recommends it).
+        """
+        sock = getattr(self.client, 'socket', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.warning(f"Could not set TCP_NODELAY: {e}")
+    
+    def _set_tcp_keepalive(self):
+        """
+        Enable TCP keepalive so a silently dropped link (dongle reboot, NAT timeout)
+        is noticed within about a minute instead of on the next read timeout.
+        """
+        sock = getattr(self.client, 'socket', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Probe after 30 s idle, every 10 s, give up after 3 misses (where supported)
+            for option, value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3)):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as e:
+            logger.warning(f"Could not enable TCP keepalive: {e}")
+    
+    def reconnect(self) -> bool:
+        """Close the connection and open a fresh one."""
+        if self.client:
+            self.client.close()
+        return self.connect()
+    
+    async def connect_async(self) -> bool:
+        """
+        Connect the asyncio client used by read_multiple_registers_async().
+        
+        asyncio already sets TCP_NODELAY on its TCP sockets, so no socket tweaks here.
+        """
+        try:
+            self.async_client = AsyncModbusTcpClient(host=self.host, port=self.port, timeout=self.timeout)
+            connected = await self.async_client.connect()
+            if connected:
+                logger.info(f"✅ Connected to Sungrow inverter at {self.host}:{self.port} (async)")
+                return True
+            else:
+                logger.error(f"❌ Failed to connect to {self.host}:{self.port}")
+                return False
+        except Exception as e:
+            logger.error(f"❌ Connection error: {e}")
+            return False
+    
     def disconnect(self):
         """Disconnect from the Modbus device."""
         if self.client:
             self.client.close()
             logger.info("🔌 Disconnected from Sungrow inverter")
+        if self.async_client:
+            self.async_client.close()
+            self.async_client = None
+    
+    def __enter__(self) -> 'SungrowModbusClient':
+        """Use as `with SungrowModbusClient() as client:`; disconnects on exit (connect() is still explicit)."""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.disconnect()
+    
+    def _build_register_plans(self):
+        """Precompute per-register decode/encode settings so the read and write paths do no config parsing."""
+        for reg_config in list(self.registers.values()) + list(self.legacy_registers.values()):
+            data_type = reg_config.get('data_type', 'uint16')
+            low_word_first = (reg_config.get('swap') == 'word'
+                              or self._get_endianness(reg_config) == Endian.LITTLE)
+            if data_type in ('uint32', 'int32', 'float32'):
+                register_count = 2
+            elif data_type == 'string':
+                register_count = reg_config.get('count', 1)
+            else:
+                register_count = 1
+            reg_config['_plan'] = {
+                'register_count': register_count,
+                'low_word_first': low_word_first,
+                'dword': _DWORD_CODECS.get((data_type, low_word_first)),
+                'pm_dtype': _NATIVE_DATATYPES.get(data_type),
+                'pm_word_order': 'little' if low_word_first else 'big',
+            }
+            if data_type == 'string':
+                reg_config['_plan']['str_struct'] = struct.Struct(f"<{reg_config.get('count', 1)}H")
+            reg_config['_plan']['decode'], reg_config['_plan']['encode'] = \
+                self._bind_codecs(data_type, reg_config.get('scale', 1), reg_config)
+    
+    @staticmethod
+    def _bind_codecs(data_type: str, scale, reg_config: dict) -> tuple:
+        """Bind the type decoder/encoder to a register, folding the scale in once.
+        
+        Identity scales get the bare codec, so most registers skip scaling entirely.
+        Either side is None when the data type has no codec.
+        """
+        raw_decode = _DECODERS.get(data_type)
+        raw_encode = _encode_native if reg_config['_plan']['pm_dtype'] else None
+        decode = encode = None
+        
+        if scale is None or scale == 1 or data_type == 'string':
+            if raw_decode:
+                decode = lambda regs, _r=raw_decode, _c=reg_config: _r(regs, _c)
+            if raw_encode:
+                encode = lambda value, _e=raw_encode, _c=reg_config: _e(value, _c)
+        else:
+            s = float(scale)
+            if raw_decode:
+                decode = lambda regs, _r=raw_decode, _c=reg_config, _s=s: _r(regs, _c) * _s
+            if raw_encode:
+                encode = lambda value, _e=raw_encode, _c=reg_config, _s=s: _e(int(value / _s), _c)
+        return decode, encode
     
     def _get_endianness(self, reg_config: dict) -> Endian:
         """Get endianness configuration."""
@@ -90,59 +312,19 @@ class SungrowModbusClient:
         """Decode register values based on data type and configuration."""
         try:
             data_type = reg_config.get('data_type', 'uint16')
-            scale = reg_config.get('scale', 1)
-            endianness = self._get_endianness(reg_config)
-            swap_word = reg_config.get('swap') == 'word'
             
             # Use new pymodbus API for decoding
-            if hasattr(self.client, 'convert_from_registers'):
-                # New API (pymodbus 3.7+)
-                if data_type == 'uint16':
-                    value = registers[0]
-                elif data_type == 'int16':
-                    value = registers[0] if registers[0] < 32768 else registers[0] - 65536
-                elif data_type == 'uint32':
-                    if swap_word:
-                        # Swap word order: second register becomes high word
-                        value = (registers[1] << 16) | registers[0]
-                    elif endianness == Endian.BIG:
-                        value = (registers[0] << 16) | registers[1]
-                    else:
-                        value = (registers[1] << 16) | registers[0]
-                elif data_type == 'int32':
-                    if swap_word:
-                        # Swap word order: second register becomes high word
-                        value = (registers[1] << 16) | registers[0]
-                    elif endianness == Endian.BIG:
-                        value = (registers[0] << 16) | registers[1]
-                    else:
-                        value = (registers[1] << 16) | registers[0]
-                    # Convert to signed
-                    if value >= 2147483648:
-                        value -= 4294967296
-                elif data_type == 'float32':
-                    # For float, we'd need struct manipulation
-                    import struct
-                    if endianness == Endian.BIG:
-                        packed = struct.pack('>HH', registers[0], registers[1])
-                    else:
-                        packed = struct.pack('<HH', registers[0], registers[1])
-                    value = struct.unpack('>f' if endianness == Endian.BIG else '<f', packed)[0]
-                elif data_type == 'string':
-                    count = reg_config.get('count', 1)
-                    chars = []
-                    for i in range(min(count, len(registers))):
-                        char_val = registers[i]
-                        if char_val != 0:
-                            chars.append(chr(char_val & 0xFF))
-                            if char_val >> 8 != 0:
-                                chars.append(chr(char_val >> 8))
-                    return ''.join(chars).strip()
-                else:
+            if _HAS_NATIVE_CODECS:
+                # New API (pymodbus 3.7+); scaling is folded into the plan's decoder
+                decode = reg_config['_plan']['decode']
+                if decode is None:
                     logger.warning(f"Unknown data type: {data_type}")
                     return None
+                return decode(registers)
             else:
                 # Fallback to old API
+                scale = reg_config.get('scale', 1)
+                endianness = self._get_endianness(reg_config)
                 from pymodbus.payload import BinaryPayloadDecoder
                 decoder = BinaryPayloadDecoder.fromRegisters(registers, byteorder=endianness, wordorder=endianness)
             
@@ -173,11 +355,11 @@ class SungrowModbusClient:
                     logger.warning(f"Unknown data type: {data_type}")
                     return None
                 
-            # Apply scaling
-            if scale != 1 and isinstance(value, (int, float)):
-                value = value * scale
-                
-            return value
+                # Apply scaling
+                if scale != 1 and isinstance(value, (int, float)):
+                    value = value * scale
+                    
+                return value
             
         except Exception as e:
             logger.error(f"Error decoding value: {e}")
@@ -187,48 +369,24 @@ class SungrowModbusClient:
         """Encode value for writing to register."""
         try:
             data_type = reg_config.get('data_type', 'uint16')
-            scale = reg_config.get('scale', 1)
-            endianness = self._get_endianness(reg_config)
-            
-            # Apply inverse scaling
-            if scale != 1:
-                value = int(value / scale)
             
             # Use new or old API for encoding
-            if hasattr(self.client, 'convert_to_registers'):
-                # New API approach (manual encoding)
-                if data_type == 'uint16':
-                    return [int(value) & 0xFFFF]
-                elif data_type == 'int16':
-                    val = int(value)
-                    return [val & 0xFFFF]
-                elif data_type == 'uint32':
-                    val = int(value)
-                    if endianness == Endian.BIG:
-                        return [(val >> 16) & 0xFFFF, val & 0xFFFF]
-                    else:
-                        return [val & 0xFFFF, (val >> 16) & 0xFFFF]
-                elif data_type == 'int32':
-                    val = int(value)
-                    if val < 0:
-                        val += 4294967296  # Convert to unsigned
-                    if endianness == Endian.BIG:
-                        return [(val >> 16) & 0xFFFF, val & 0xFFFF]
-                    else:
-                        return [val & 0xFFFF, (val >> 16) & 0xFFFF]
-                elif data_type == 'float32':
-                    import struct
-                    if endianness == Endian.BIG:
-                        packed = struct.pack('>f', float(value))
-                        return list(struct.unpack('>HH', packed))
-                    else:
-                        packed = struct.pack('<f', float(value))
-                        return list(struct.unpack('<HH', packed))
-                else:
+            if _HAS_NATIVE_CODECS:
+                # New API (pymodbus 3.7+); inverse scaling is folded into the plan's encoder
+                encode = reg_config['_plan']['encode']
+                if encode is None:
                     logger.warning(f"Unknown data type for writing: {data_type}")
                     return []
+                return encode(value)
             else:
                 # Fallback to old API
+                scale = reg_config.get('scale', 1)
+                endianness = self._get_endianness(reg_config)
+                
+                # Apply inverse scaling
+                if scale != 1:
+                    value = int(value / scale)
+                
                 from pymodbus.payload import BinaryPayloadBuilder
                 builder = BinaryPayloadBuilder(byteorder=endianness, wordorder=endianness)
                 
@@ -271,17 +429,8 @@ class SungrowModbusClient:
         
         try:
             address = reg_config['address']
-            data_type = reg_config.get('data_type', 'uint16')
             function_code = reg_config.get('function_code', 4)  # Default to input registers
-            count = reg_config.get('count', 1)
-            
-            # Determine register count based on data type
-            if data_type in ['uint32', 'int32', 'float32']:
-                register_count = 2
-            elif data_type == 'string':
-                register_count = count
-            else:
-                register_count = 1
+            register_count = reg_config['_plan']['register_count']
             
             # Add delay between requests
             if self.delay:
@@ -308,6 +457,10 @@ class SungrowModbusClient:
             
             return value
             
+        except (ConnectionException, ModbusIOException) as e:
+            logger.error(f"No response reading register {register_name}: {e}")
+            self.connection_lost = True
+            return None
         except Exception as e:
             logger.error(f"Exception reading register {register_name}: {e}")
             return None
@@ -318,24 +471,12 @@ class SungrowModbusClient:
             logger.error("Not connected to Modbus device")
             return False
             
-        # Check if register exists and is writable
-        if register_name not in self.registers:
-            logger.error(f"Register '{register_name}' not found in configuration")
-            return False
-            
-        reg_config = self.registers[register_name]
-        
-        if not reg_config.get('writable', False):
-            logger.error(f"Register '{register_name}' is not writable")
+        reg_config = self._get_writable_config(register_name)
+        if reg_config is None:
             return False
         
         try:
             address = reg_config['address']
-            function_code = reg_config.get('function_code', 3)  # Default to holding registers
-            
-            if function_code != 3:
-                logger.error(f"Cannot write to register with function code {function_code}")
-                return False
             
             # Encode the value
             encoded_registers = self._encode_value(value, reg_config)
@@ -352,6 +493,7 @@ class SungrowModbusClient:
             else:
                 result = self.client.write_registers(address=address, values=encoded_registers, slave=self.slave_id)
             
+            self._cache.pop(register_name, None)
             if result.isError():
                 logger.error(f"Error writing register {register_name} at address {address}: {result}")
                 return False
@@ -363,23 +505,427 @@ class SungrowModbusClient:
             logger.error(f"Exception writing register {register_name}: {e}")
             return False
     
-    def read_multiple_registers(self, register_names: list) -> Dict[str, Any]:
-        """Read multiple registers efficiently."""
+    def _get_writable_config(self, register_name: str) -> Optional[dict]:
+        """Return the config of a writable holding register, or None (with an error logged)."""
+        # Check if register exists and is writable
+        if register_name not in self.registers:
+            logger.error(f"Register '{register_name}' not found in configuration")
+            return None
+            
+        reg_config = self.registers[register_name]
+        
+        if not reg_config.get('writable', False):
+            logger.error(f"Register '{register_name}' is not writable")
+            return None
+        
+        function_code = reg_config.get('function_code', 3)  # Default to holding registers
+        if function_code != 3:
+            logger.error(f"Cannot write to register with function code {function_code}")
+            return None
+        
+        return reg_config
+    
+    def _write_batch(self, updates: List[Tuple[str, Union[int, float]]]) -> bool:
+        """
+        Write several registers, coalescing contiguous addresses into one request.
+        
+        Registers whose addresses follow each other (e.g. EMS mode, forced command and
+        forced power at 13049-13051) go out as a single write_registers (FC16) call
+        instead of one round-trip plus delay per register. Non-contiguous registers
+        are written in separate requests.
+        """
+        if not self.client:
+            logger.error("Not connected to Modbus device")
+            return False
+        
+        # Validate and encode everything up front so a bad value aborts before any write
+        encoded = []
+        for register_name, value in updates:
+            reg_config = self._get_writable_config(register_name)
+            if reg_config is None:
+                return False
+            words = self._encode_value(value, reg_config)
+            if not words:
+                return False
+            encoded.append((reg_config['address'], register_name, value, words))
+        encoded.sort(key=lambda item: item[0])
+        
+        # Group into runs of contiguous addresses
+        runs = []
+        for address, register_name, value, words in encoded:
+            if runs and runs[-1]['end'] == address:
+                run = runs[-1]
+            else:
+                run = {'start': address, 'end': address, 'values': [], 'written': []}
+                runs.append(run)
+            run['values'].extend(words)
+            run['end'] = address + len(words)
+            run['written'].append((register_name, value))
+        
+        for run in runs:
+            start = run['start']
+            try:
+                # Add delay between requests
+                if self.delay:
+                    time.sleep(self.delay)
+                
+                if len(run['values']) == 1:
+                    result = self.client.write_register(address=start, value=run['values'][0], slave=self.slave_id)
+                else:
+                    result = self.client.write_registers(address=start, values=run['values'], slave=self.slave_id)
+                
+                self.invalidate_cache([register_name for register_name, _ in run['written']])
+                if result.isError():
+                    logger.error(f"Error writing registers at address {start}: {result}")
+                    return False
+                
+            except Exception as e:
+                logger.error(f"Exception writing registers at address {start}: {e}")
+                return False
+            
+            for register_name, value in run['written']:
+                unit = self.registers[register_name].get('unit', '')
+                logger.info(f"✅ Wrote {register_name}: {value} {unit}")
+        
+        return True
+    
+    def read_multiple_registers(self, register_names: list, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Read multiple registers efficiently.
+        
+        Registers are fetched in as few requests as possible: addresses with the same
+        function code are merged into blocks of up to max_block_size registers, as long
+        as the gap between neighbours is at most block_gap registers. A block that the
+        device rejects (e.g. because the gap spans unmapped addresses) is read register by
+        register from then on. If the device stops answering altogether, the remaining
+        registers come back as None and connection_lost is set, instead of every
+        register waiting out its own timeout.
+        
+        With max_age (seconds) set, values read less than max_age ago are served from
+        the cache. A register's own scan_interval from the config overrides max_age, so
+        static values like the serial number are only re-read every few minutes.
+        Without max_age every register is read from the device.
+        """
+        results, to_read = self._split_cached(register_names, max_age)
+        self.connection_lost = False
+        
+        if to_read:
+            for block in self._get_block_plan(to_read):
+                values = None
+                if not (block['split'] or self.connection_lost):
+                    values = self._read_block(block)
+                if values is None:
+                    values = {}
+                    for register_name in block['names']:
+                        values[register_name] = None if self.connection_lost else self.read_register(register_name)
+                self._store_values(results, values)
+        
+        return {register_name: results[register_name] for register_name in register_names}
+    
+    async def read_multiple_registers_async(self, register_names: list, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Asyncio version of read_multiple_registers() on the client from connect_async().
+        
+        Same caching and block planning. With delay set the blocks are read one after
+        another so the configured spacing between requests is kept; with delay 0 they
+        are all issued at once.
+        """
+        results, to_read = self._split_cached(register_names, max_age)
+        self.connection_lost = False
+        
+        if to_read:
+            blocks = self._get_block_plan(to_read)
+            if self.delay:
+                block_values = [await self._read_block_async(block) for block in blocks]
+            else:
+                block_values = await asyncio.gather(*(self._read_block_async(block) for block in blocks))
+            
+            for block, values in zip(blocks, block_values):
+                if values is None:
+                    values = {}
+                    for register_name in block['names']:
+                        values[register_name] = None if self.connection_lost else await self._read_register_async(register_name)
+                self._store_values(results, values)
+        
+        return {register_name: results[register_name] for register_name in register_names}
+    
+    def _split_cached(self, register_names: list, max_age: Optional[float]) -> Tuple[Dict[str, Any], list]:
+        """Return (values still fresh in the cache, names that need a device read)."""
         results = {}
+        to_read = []
+        now = time.monotonic()
         
         for register_name in register_names:
-            value = self.read_register(register_name)
+            if max_age is not None:
+                cached = self._cache.get(register_name)
+                if cached is not None:
+                    reg_config = self.registers.get(register_name) or self.legacy_registers.get(register_name) or {}
+                    ttl = reg_config.get('scan_interval', max_age)
+                    if now - cached[1] < ttl:
+                        results[register_name] = cached[0]
+                        continue
+            to_read.append(register_name)
+        
+        return results, to_read
+    
+    def _get_block_plan(self, register_names: list) -> list:
+        """Return the (cached) read blocks for a list of register names."""
+        key = tuple(register_names)
+        blocks = self._block_plans.get(key)
+        if blocks is None:
+            blocks = self._block_plans[key] = self._plan_blocks(register_names)
+        return blocks
+    
+    def _store_values(self, results: Dict[str, Any], values: Dict[str, Any]):
+        """Copy freshly read values into results and the cache."""
+        read_time = time.monotonic()
+        for register_name, value in values.items():
+            if value is not None:
+                self._cache[register_name] = (value, read_time)
+                self.last_read_time = read_time
             results[register_name] = value
+    
+    def _plan_blocks(self, register_names: list) -> list:
+        """
+        Group registers into contiguous read blocks.
+        
+        Each block is a dict with function_code, start, end, members
+        [(register name, offset into block, reg_config)] and a split flag. Unknown
+        registers end up in a split block and are read individually so the usual error
+        is logged.
+        """
+        by_function = {}
+        unknown = []
+        for register_name in dict.fromkeys(register_names):
+            reg_config = self.registers.get(register_name) or self.legacy_registers.get(register_name)
+            if reg_config is None:
+                unknown.append(register_name)
+                continue
+            function_code = reg_config.get('function_code', 4)
+            by_function.setdefault(function_code, []).append((reg_config['address'], register_name, reg_config))
+        
+        blocks = []
+        for function_code, entries in by_function.items():
+            entries.sort(key=lambda entry: entry[0])
+            block = None
+            for address, register_name, reg_config in entries:
+                end = address + reg_config['_plan']['register_count']
+                if (block is None
+                        or address - block['end'] > self.block_gap
+                        or max(end, block['end']) - block['start'] > self.max_block_size):
+                    block = {'function_code': function_code, 'start': address, 'end': end,
+                             'members': [], 'names': [], 'split': False}
+                    blocks.append(block)
+                block['end'] = max(block['end'], end)
+                block['members'].append((register_name, address - block['start'], reg_config))
+                block['names'].append(register_name)
+        
+        for block in blocks:
+            self._compile_block_codec(block)
+        
+        if unknown:
+            blocks.append({'function_code': None, 'start': None, 'end': None,
+                           'members': [], 'names': unknown, 'split': True, 'codec': None})
+        return blocks
+    
+    @staticmethod
+    def _compile_block_codec(block: dict):
+        """
+        Precompile a struct that decodes a whole block in one call.
+        
+        The block's words are packed in the word order of its 32-bit members, which
+        turns every 16/32-bit integer or float into a plain struct field (unread
+        registers in between become pad bytes). Members that don't fit, such as strings,
+        overlapping registers or 32-bit values in the other word order, keep their
+        per-register decoder.
+        """
+        # Follow the word order most 32-bit members use
+        dword_orders = [reg_config['_plan']['low_word_first']
+                        for _, _, reg_config in block['members'] if reg_config['_plan']['dword']]
+        low_word_first = 2 * sum(dword_orders) > len(dword_orders)
+        order = '<' if low_word_first else '>'
+        fields = [order]
+        names = []
+        scaled = []
+        others = []
+        position = 0
+        for register_name, offset, reg_config in block['members']:
+            plan = reg_config['_plan']
+            code = _STRUCT_CODES.get(reg_config.get('data_type', 'uint16'))
+            if (code is None or plan['decode'] is None or offset < position
+                    or (plan['dword'] and plan['low_word_first'] != low_word_first)):
+                others.append((register_name, offset, reg_config))
+                continue
+            if offset > position:
+                fields.append(f'{2 * (offset - position)}x')
+            fields.append(code)
+            names.append(register_name)
+            scale = reg_config.get('scale', 1)
+            if scale is not None and scale != 1:
+                scaled.append((register_name, float(scale)))
+            position = offset + plan['register_count']
+        
+        block['codec'] = {
+            'count': block['end'] - block['start'],
+            'words': struct.Struct(f"{order}{block['end'] - block['start']}H"),
+            'fields': struct.Struct(''.join(fields)),
+            'names': names,
+            'scaled': scaled,
+            'others': others,
+        }
+    
+    def _read_block(self, block: dict) -> Optional[Dict[str, Any]]:
+        """Read one block in a single request and decode its registers, or None on failure."""
+        if not self.client:
+            logger.error("Not connected to Modbus device")
+            return None
+        
+        start = block['start']
+        count = block['end'] - start
+        try:
+            # Add delay between requests
+            if self.delay:
+                time.sleep(self.delay)
+            
+            if block['function_code'] == 3:  # Holding registers
+                result = self.client.read_holding_registers(address=start, count=count, slave=self.slave_id)
+            elif block['function_code'] == 4:  # Input registers
+                result = self.client.read_input_registers(address=start, count=count, slave=self.slave_id)
+            else:
+                logger.error(f"Unsupported function code: {block['function_code']}")
+                return None
+            
+            if result.isError() or len(result.registers) < count:
+                logger.warning(f"Block read of {count} registers at {start} rejected, reading them individually: {result}")
+                block['split'] = True
+                return None
             
-        return results
+        except (ConnectionException, ModbusIOException) as e:
+            # No answer at all; reading the block register by register would only
+            # repeat the timeout, so the rest of this pass is skipped
+            logger.warning(f"No response reading block at {start}: {e}")
+            self.connection_lost = True
+            return None
+        except Exception as e:
+            logger.debug(f"Exception reading block at {start}, reading individually: {e}")
+            return None
+        
+        return self._decode_block(block, result.registers)
+    
+    def _decode_block(self, block: dict, registers: list) -> Dict[str, Any]:
+        """Decode a block's registers into its members, in one struct call where possible."""
+        codec = block['codec']
+        if _HAS_NATIVE_CODECS and len(registers) == codec['count']:
+            try:
+                values = dict(zip(codec['names'], codec['fields'].unpack_from(codec['words'].pack(*registers))))
+            except struct.error as e:
+                logger.debug(f"Block codec failed at {block['start']}, decoding per register: {e}")
+            else:
+                for register_name, scale in codec['scaled']:
+                    values[register_name] *= scale
+                for register_name, offset, reg_config in codec['others']:
+                    words = registers[offset:offset + reg_config['_plan']['register_count']]
+                    values[register_name] = self._decode_value(words, reg_config)
+                return values
+        
+        values = {}
+        for register_name, offset, reg_config in block['members']:
+            words = registers[offset:offset + reg_config['_plan']['register_count']]
+            values[register_name] = self._decode_value(words, reg_config)
+        return values
+    
+    async def _read_async(self, function_code: int, address: int, count: int):
+        """Issue one read on the async client; None for an unsupported function code."""
+        # Add delay between requests
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        
+        if function_code == 3:  # Holding registers
+            return await self.async_client.read_holding_registers(address=address, count=count, slave=self.slave_id)
+        if function_code == 4:  # Input registers
+            return await self.async_client.read_input_registers(address=address, count=count, slave=self.slave_id)
+        logger.error(f"Unsupported function code: {function_code}")
+        return None
+    
+    async def _read_block_async(self, block: dict) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _read_block()."""
+        if block['split']:
+            return None
+        if not self.async_client:
+            logger.error("Not connected to Modbus device")
+            return None
+        
+        start = block['start']
+        count = block['end'] - start
+        try:
+            result = await self._read_async(block['function_code'], start, count)
+            if result is None:
+                return None
+            
+            if result.isError() or len(result.registers) < count:
+                logger.warning(f"Block read of {count} registers at {start} rejected, reading them individually: {result}")
+                block['split'] = True
+                return None
+            
+        except (ConnectionException, ModbusIOException) as e:
+            # No answer at all; reading the block register by register would only
+            # repeat the timeout, so the rest of this pass is skipped
+            logger.warning(f"No response reading block at {start}: {e}")
+            self.connection_lost = True
+            return None
+        except Exception as e:
+            logger.debug(f"Exception reading block at {start}, reading individually: {e}")
+            return None
+        
+        return self._decode_block(block, result.registers)
+    
+    async def _read_register_async(self, register_name: str) -> Optional[Union[int, float, str]]:
+        """Async counterpart of read_register()."""
+        if not self.async_client:
+            logger.error("Not connected to Modbus device")
+            return None
+        
+        reg_config = self.registers.get(register_name) or self.legacy_registers.get(register_name)
+        if reg_config is None:
+            logger.error(f"Register '{register_name}' not found in configuration")
+            return None
+        
+        try:
+            address = reg_config['address']
+            result = await self._read_async(reg_config.get('function_code', 4), address,
+                                            reg_config['_plan']['register_count'])
+            if result is None:
+                return None
+            
+            if result.isError():
+                logger.error(f"Error reading register {register_name} at address {address}: {result}")
+                return None
+            
+            return self._decode_value(result.registers, reg_config)
+            
+        except (ConnectionException, ModbusIOException) as e:
+            logger.error(f"No response reading register {register_name}: {e}")
+            self.connection_lost = True
+            return None
+        except Exception as e:
+            logger.error(f"Exception reading register {register_name}: {e}")
+            return None
+    
+    def invalidate_cache(self, register_names: Optional[list] = None):
+        """Drop cached values for the given registers (or all of them)."""
+        if register_names is None:
+            self._cache.clear()
+        else:
+            for register_name in register_names:
+                self._cache.pop(register_name, None)
     
     def get_register_info(self, register_name: str) -> Optional[dict]:
         """Get register configuration information."""
-        if register_name in self.registers:
-            return self.registers[register_name].copy()
-        elif register_name in self.legacy_registers:
-            return self.legacy_registers[register_name].copy()
-        return None
+        reg_config = self.registers.get(register_name) or self.legacy_registers.get(register_name)
+        if reg_config is None:
+            return None
+        # Hide the precomputed decode plan, callers only want the YAML settings
+        return {key: value for key, value in reg_config.items() if not key.startswith('_')}
     
     def list_registers(self) -> list:
         """List all available registers."""
@@ -393,35 +939,41 @@ class SungrowModbusClient:
                 writable.append(name)
         return writable
     
-    def get_system_info(self) -> Dict[str, Any]:
-        """Get basic system information."""
+    def get_system_info(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Get basic system information (cached for max_age seconds, default _DEFAULT_TTLS['system'])."""
         info_registers = [
             'inverter_serial', 'device_type_code', 'system_state', 'running_state',
             'inverter_temperature', 'grid_frequency'
         ]
         
-        return self.read_multiple_registers(info_registers)
+        if max_age is None:
+            max_age = self._DEFAULT_TTLS['system']
+        return self.read_multiple_registers(info_registers, max_age=max_age)
     
-    def get_power_data(self) -> Dict[str, Any]:
-        """Get power-related data."""
+    def get_power_data(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Get power-related data (cached for max_age seconds, default _DEFAULT_TTLS['power'])."""
         power_registers = [
             'total_dc_power', 'total_active_power', 'load_power', 'export_power_raw',
             'meter_active_power', 'battery_power_raw'
         ]
         
-        return self.read_multiple_registers(power_registers)
+        if max_age is None:
+            max_age = self._DEFAULT_TTLS['power']
+        return self.read_multiple_registers(power_registers, max_age=max_age)
     
-    def get_battery_data(self) -> Dict[str, Any]:
-        """Get battery-related data."""
+    def get_battery_data(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Get battery-related data (cached for max_age seconds, default _DEFAULT_TTLS['battery'])."""
         battery_registers = [
             'battery_level', 'battery_voltage', 'battery_current', 'battery_power_raw',
             'battery_temperature', 'battery_state_of_health', 'battery_capacity'
         ]
         
-        return self.read_multiple_registers(battery_registers)
+        if max_age is None:
+            max_age = self._DEFAULT_TTLS['battery']
+        return self.read_multiple_registers(battery_registers, max_age=max_age)
     
-    def get_energy_data(self) -> Dict[str, Any]:
-        """Get energy counter data."""
+    def get_energy_data(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Get energy counter data (cached for max_age seconds, default _DEFAULT_TTLS['energy'])."""
         energy_registers = [
             'daily_pv_generation', 'total_pv_generation',
             'daily_imported_energy', 'total_imported_energy',
@@ -430,48 +982,37 @@ class SungrowModbusClient:
             'daily_battery_discharge', 'total_battery_discharge'
         ]
         
-        return self.read_multiple_registers(energy_registers)
+        if max_age is None:
+            max_age = self._DEFAULT_TTLS['energy']
+        return self.read_multiple_registers(energy_registers, max_age=max_age)
     
     # Control functions for common operations
     def set_ems_mode(self, mode: str) -> bool:
         """Set EMS mode. Options: 'self_consumption', 'forced', 'external_ems'"""
-        mode_values = {
-            'self_consumption': 0,
-            'forced': 2,
-            'external_ems': 3
-        }
-        
-        if mode not in mode_values:
-            logger.error(f"Invalid EMS mode: {mode}. Valid options: {list(mode_values.keys())}")
+        mode_value = self._EMS_MODES.get(mode)
+        if mode_value is None:
+            logger.error(f"Invalid EMS mode: {mode}. Valid options: {list(self._EMS_MODES)}")
             return False
             
-        return self.write_register('ems_mode_selection', mode_values[mode])
+        return self.write_register('ems_mode_selection', mode_value)
     
     def set_battery_forced_mode(self, command: str, power: int = 0) -> bool:
         """Set battery forced charge/discharge mode."""
-        commands = {
-            'stop': 0xCC,
-            'charge': 0xAA,
-            'discharge': 0xBB
-        }
-        
-        if command not in commands:
-            logger.error(f"Invalid command: {command}. Valid options: {list(commands.keys())}")
-            return False
-        
-        # First set EMS to forced mode
-        if not self.set_ems_mode('forced'):
+        command_value = self._BATTERY_CMDS.get(command)
+        if command_value is None:
+            logger.error(f"Invalid command: {command}. Valid options: {list(self._BATTERY_CMDS)}")
             return False
         
-        # Set the command
-        if not self.write_register('battery_forced_charge_discharge_cmd', commands[command]):
-            return False
-        
-        # Set power if specified
+        # EMS forced mode, command and (optional) power are adjacent holding
+        # registers, so they go out together in a single request
+        updates = [
+            ('ems_mode_selection', self._EMS_MODES['forced']),
+            ('battery_forced_charge_discharge_cmd', command_value),
+        ]
         if power > 0:
-            return self.write_register('battery_forced_charge_discharge_power', power)
+            updates.append(('battery_forced_charge_discharge_power', power))
             
-        return True
+        return self._write_batch(updates)
     
     def set_soc_limits(self, min_soc: float, max_soc: float) -> bool:
         """Set battery SOC limits."""
@@ -483,21 +1024,17 @@ class SungrowModbusClient:
             logger.error("Min SOC must be less than Max SOC")
             return False
         
-        min_success = self.write_register('min_soc', min_soc)
-        max_success = self.write_register('max_soc', max_soc)
-        
-        return min_success and max_success
+        # max_soc/min_soc are adjacent holding registers, written in one request
+        return self._write_batch([('min_soc', min_soc), ('max_soc', max_soc)])
     
     def set_export_power_limit(self, limit: int, enable: bool = True) -> bool:
         """Set export power limit."""
-        # Set the limit value
-        limit_success = self.write_register('export_power_limit', limit)
-        
-        # Enable or disable the limit
-        mode_value = 0xAA if enable else 0x55
-        mode_success = self.write_register('export_power_limit_mode', mode_value)
-        
-        return limit_success and mode_success
+        # The limit (13073) and its mode (13086) are not adjacent, so this is still two
+        # requests, but both values are validated before either is written
+        return self._write_batch([
+            ('export_power_limit', limit),
+            ('export_power_limit_mode', self._EXPORT_MODE[bool(enable)]),
+        ])
 
 
 def test_connection():
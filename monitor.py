@@ -4,29 +4,289 @@ Enhanced Real-time Sungrow Inverter Monitor
 Thermodynamically correct energy balance with comprehensive statistics
 """
 
+import asyncio
 import time
+import shutil
 import signal
 import sys
-import os
-from collections import deque, defaultdict
-import statistics
+from array import array
+from functools import lru_cache
+from operator import itemgetter
 import math
+from unicodedata import east_asian_width
 from sungrow_controller import SungrowController
 
 
+# ANSI erase-display + cursor-home; avoids forking `clear`/`cls` on every frame
+_CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+# Lines and terminal size of the last frame drawn on the TTY, for diffed redraws
+_previous_frame = {'lines': None, 'size': None}
+
+
+@lru_cache(maxsize=256)
+def _display_width(line):
+    """Terminal cells a line occupies; wide (East Asian / emoji) characters count double."""
+    if line.isascii():
+        return len(line)
+    return sum(2 if east_asian_width(ch) in 'WF' else 1 for ch in line)
+
+
+def write_frame(text):
+    """
+    Replace the screen contents with one rendered frame in a single write.
+    
+    On a TTY only the lines that differ from the previous frame are rewritten,
+    using cursor addressing (row;1H + line + erase-to-end-of-line). The screen is
+    cleared and fully redrawn on the first frame, after a terminal resize, when
+    the frame is taller than the terminal (it would scroll), or when a line fills
+    the terminal width: wrapped lines take several screen rows, so line numbers
+    no longer match rows (the next frame is then redrawn in full as well). Off a
+    TTY the frame is written as plain text.
+    """
+    if not sys.stdout.isatty():
+        sys.stdout.write(text + "\n")
+        sys.stdout.flush()
+        return
+    
+    lines = text.split("\n")
+    size = shutil.get_terminal_size()
+    previous = _previous_frame['lines']
+    # A line as wide as the terminal already leaves the cursor in the wrap position
+    wraps = any(_display_width(line) >= size.columns for line in lines)
+    
+    if previous is None or wraps or size != _previous_frame['size'] or len(lines) >= size.lines:
+        out = _CLEAR_SCREEN + text + "\n"
+    else:
+        parts = []
+        for row, line in enumerate(lines, start=1):
+            if row > len(previous) or previous[row - 1] != line:
+                parts.append(f"\x1b[{row};1H{line}\x1b[K")
+        if len(lines) < len(previous):
+            parts.append(f"\x1b[{len(lines) + 1};1H\x1b[J")  # erase leftover lines
+        parts.append(f"\x1b[{len(lines) + 1};1H")
+        out = "".join(parts)
+    
+    _previous_frame['lines'] = None if wraps else lines
+    _previous_frame['size'] = size
+    sys.stdout.write(out)
+    sys.stdout.flush()
+
+
+def _flow_direction(watts, deadband=10):
+    """Return 1 / -1 for flows beyond the deadband in either direction, 0 when idle."""
+    return (watts > deadband) - (watts < -deadband)
+
+
+# Fields pulled from SungrowController.get_current_state() each poll
+_POWER_FIELDS = itemgetter('solar_power', 'battery_power', 'grid_power',
+                           'grid_frequency', 'inverter_temperature')
+_SYSTEM_FIELDS = itemgetter('ems_mode', 'system_state', 'running_state')
+
+STAT_FIELDS = ('current', 'avg', 'max', 'min', 'std_dev', 'range', 'trend')
+
+
+def window_stats_kernel(n, window, sum_x, slope_denominator, update_frequency,
+                        current, sums, sum_sqs, sum_xys, mins, maxs, streams=None):
+    """
+    Compute per-stream window statistics from running sums in one pass.
+    
+    Operates on flat per-stream lists and returns one row in STAT_FIELDS order
+    for each index in `streams` (default: every stream).
+    """
+    sqrt = math.sqrt
+    with_trend = n == window and n >= 20 and slope_denominator != 0
+    rows = []
+    for i in (range(len(sums)) if streams is None else streams):
+        mean = sums[i] / n
+        variance = (sum_sqs[i] - n * mean * mean) / (n - 1) if n > 1 else 0.0
+        trend = 0
+        if with_trend:
+            trend = (n * sum_xys[i] - sum_x * sums[i]) / slope_denominator * update_frequency
+        rows.append((current[i], mean, maxs[i], mins[i],
+                     sqrt(variance) if variance > 0 else 0.0, maxs[i] - mins[i], trend))
+    return rows
+
+
+class RollingStats:
+    """
+    Sliding-window statistics for several streams, updated in O(1) per sample.
+    
+    All streams share one ring-buffer cursor; each stream is a float32 column with
+    running sums (Σy, Σy², Σxy) so mean, standard deviation and trend slope
+    need no pass over the history. Min/max are only rescanned when the evicted
+    sample was the cached extreme.
+    """
+    
+    def __init__(self, keys, window):
+        self.keys = tuple(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.window = window
+        self.cursor = 0  # next write slot; oldest sample once the window is full
+        self.count = 0
+        
+        k = len(self.keys)
+        # float32 columns: unboxed and half the size of Python floats, still far finer
+        # than the 0.1 W / 0.01 Hz resolution of the inverter registers
+        self.columns = [array('f', [0.0]) * window for _ in range(k)]
+        self.current = [0.0] * k
+        self.sum = [0.0] * k
+        self.sum_sq = [0.0] * k
+        self.sum_xy = [0.0] * k  # x = 0 for the oldest sample in the window
+        self.min = [math.inf] * k
+        self.max = [-math.inf] * k
+        
+        # Per-stream statistics dicts from the last summary; only dirty streams are recomputed
+        self._summary_cache = [None] * k
+        self._summary_frequency = None
+        self._dirty = set(range(k))
+        
+        # Least-squares constants for x = 0..window-1
+        n = window
+        self.sum_x = n * (n - 1) / 2
+        self.slope_denominator = n * ((n - 1) * n * (2 * n - 1) / 6) - self.sum_x * self.sum_x
+    
+    def append(self, values):
+        """Add one sample per stream (in `keys` order), evicting the oldest once full."""
+        n = self.window
+        full = self.count == n
+        slot = self.cursor
+        
+        for i, value in enumerate(values):
+            if full and value == self.current[i] and self.min[i] == self.max[i]:
+                # Same reading into a constant window: evicting and re-adding the value
+                # leaves every sum (and so every statistic, trend included) unchanged
+                continue
+            self._dirty.add(i)
+            
+            column = self.columns[i]
+            old = column[slot]
+            column[slot] = value
+            self.current[i] = float(value)
+            # Use the stored float32 value so the sums match what is evicted later
+            value = column[slot]
+            
+            if full:
+                # Remaining samples each shift one step towards x = 0
+                self.sum_xy[i] += (n - 1) * value - (self.sum[i] - old)
+                self.sum[i] += value - old
+                self.sum_sq[i] += value * value - old * old
+                
+                if old == self.min[i] or old == self.max[i]:
+                    self.min[i] = min(column)
+                    self.max[i] = max(column)
+                    continue
+            else:
+                self.sum_xy[i] += self.count * value
+                self.sum[i] += value
+                self.sum_sq[i] += value * value
+            
+            if value < self.min[i]:
+                self.min[i] = value
+            if value > self.max[i]:
+                self.max[i] = value
+        
+        if not full:
+            self.count += 1
+        self.cursor = (slot + 1) % n
+        if self.cursor == 0:
+            self._resync()
+    
+    def _resync(self):
+        """Recompute the running sums exactly once per wrap to stop float drift."""
+        # Only called when cursor wraps to 0, so columns are in oldest-first order
+        for i, column in enumerate(self.columns):
+            values = column[:self.count]
+            self.sum[i] = sum(values)
+            self.sum_sq[i] = sum(v * v for v in values)
+            self.sum_xy[i] = sum(x * v for x, v in enumerate(values))
+        self._dirty.update(range(len(self.columns)))
+    
+    def _summaries(self, update_frequency):
+        """Return the per-stream statistics dicts, recomputing only streams that changed."""
+        if update_frequency != self._summary_frequency:
+            self._summary_frequency = update_frequency
+            self._dirty.update(range(len(self.keys)))
+        
+        if self._dirty:
+            streams = sorted(self._dirty)
+            rows = window_stats_kernel(self.count, self.window, self.sum_x, self.slope_denominator,
+                                       update_frequency, self.current, self.sum, self.sum_sq,
+                                       self.sum_xy, self.min, self.max, streams)
+            for i, row in zip(streams, rows):
+                self._summary_cache[i] = dict(zip(STAT_FIELDS, row))
+            self._dirty.clear()
+        return self._summary_cache
+    
+    def stream_summary(self, key, update_frequency):
+        """Return the statistics dict for one stream (treat as read-only, it is cached)."""
+        return self._summaries(update_frequency)[self.index[key]]
+    
+    def summary(self, update_frequency):
+        """Return statistics for every stream, keyed by stream name."""
+        if self.count < 2:
+            return {key: dict.fromkeys(STAT_FIELDS, 0) for key in self.keys}
+        return dict(zip(self.keys, self._summaries(update_frequency)))
+
+
 class EnhancedSungrowMonitor:
+    # Parameters shown in the statistics table
+    STAT_KEYS = ('solar_power', 'battery_power', 'grid_power', 'house_load',
+                 'battery_soc', 'grid_frequency', 'inverter_temp')
+    
+    # Statistics table rows: (label, stats key, unit)
+    POWER_PARAMS = (
+        ('Solar Power', 'solar_power', 'W'),
+        ('Battery Power', 'battery_power', 'W'),
+        ('Grid Power', 'grid_power', 'W'),
+        ('House Load', 'house_load', 'W'),
+    )
+    SYSTEM_PARAMS = (
+        ('Battery SOC', 'battery_soc', '%'),
+        ('Grid Frequency', 'grid_frequency', 'Hz'),
+        ('Inverter Temp', 'inverter_temp', '°C'),
+    )
+    
+    # Flow status text by direction (see _flow_direction)
+    _BATTERY_STATUS = {1: "Charging at {}", -1: "Discharging at {}", 0: "Idle"}
+    _GRID_STATUS = {1: "Exporting {}", -1: "Importing {}", 0: "Balanced"}
+    
+    # Static parts of the frame, built once rather than on every refresh
+    _THERMO_TITLE = "\n".join([
+        "\n" + "="*80,
+        "🌡️  THERMODYNAMIC ENERGY BALANCE - SITE BOUNDARY",
+        "="*80,
+    ])
+    _SIGN_LEGEND = "\n".join([
+        "📊 SIGN CONVENTIONS:",
+        "   P_sun  > 0: Solar generation     | P_batt > 0: Battery charging",
+        "   P_grid > 0: Grid export          | P_batt < 0: Battery discharging",
+        "   P_grid < 0: Grid import          | P_load > 0: House consumption",
+        "\n⚖️  FUNDAMENTAL ENERGY BALANCE:",
+        "   P_grid = P_sun - P_load - P_batt",
+    ])
+    _TABLE_TITLE = "\n".join([
+        "\n" + "="*120,
+        "📊 COMPREHENSIVE SYSTEM STATISTICS",
+        "="*120,
+    ])
+    _TABLE_HEADER = (f"│ {'Parameter':<20} │ {'Current':<12} │ {'Average':<12} │ {'Max':<12} │ "
+                     f"{'Min':<12} │ {'Std Dev':<10} │ {'Range':<12} │ {'Trend/s':<10} │")
+    _COLUMN_WIDTHS = (21, 13, 13, 13, 13, 11, 13, 11)
+    _SEP_MID = "├" + "┼".join(["─"*width for width in _COLUMN_WIDTHS]) + "┤"
+    _SEP_BOTTOM = "└" + "┴".join(["─"*width for width in _COLUMN_WIDTHS]) + "┘"
+    
     def __init__(self, update_frequency=2.0):  # 2 Hz - realistic for Modbus TCP
         self.controller = SungrowController()
         self.running = False
         self.update_frequency = update_frequency
         self.update_interval = 1.0 / update_frequency  # 0.5 seconds for 2 Hz
-        
-        # Enhanced data storage for statistics  
-        self.data_history = defaultdict(lambda: deque(maxlen=60))   # 30 seconds at 2 Hz
-        self.long_history = defaultdict(lambda: deque(maxlen=600))  # 5 minutes at 2 Hz
+        self.snapshot_queue = None  # latest (current_data, stats), created in run()
+        self.late_updates = 0  # polls that overran their update interval
         
         # Statistics tracking
         self.stats_window = 20  # Last 10 seconds for real-time stats (20 samples at 2 Hz)
+        self.rolling_stats = RollingStats(self.STAT_KEYS, self.stats_window)
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -37,8 +297,10 @@ class EnhancedSungrowMonitor:
         print("\n🛑 Shutdown signal received. Stopping monitor...")
         self.running = False
     
-    def format_power(self, watts):
-        """Format power values with appropriate units."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_power(watts):
+        """Format power values with appropriate units (memoised, readings repeat across frames)."""
         if abs(watts) >= 1000:
             return f"{watts/1000:.2f} kW"
         else:
@@ -53,46 +315,10 @@ class EnhancedSungrowMonitor:
     
     def calculate_statistics(self, data_key):
         """Calculate comprehensive statistics for a data series."""
-        if data_key not in self.data_history or len(self.data_history[data_key]) < 2:
-            return {
-                'current': 0, 'avg': 0, 'max': 0, 'min': 0, 
-                'std_dev': 0, 'range': 0, 'trend': 0
-            }
-        
-        data = list(self.data_history[data_key])
-        recent_data = data[-min(self.stats_window, len(data)):]
-        
-        current = data[-1] if data else 0
-        avg = statistics.mean(recent_data)
-        max_val = max(recent_data)
-        min_val = min(recent_data)
-        std_dev = statistics.stdev(recent_data) if len(recent_data) > 1 else 0
-        range_val = max_val - min_val
-        
-        # Calculate trend (slope of last 20 points)
-        trend = 0
-        if len(recent_data) >= 20:
-            x = list(range(len(recent_data[-20:])))
-            y = recent_data[-20:]
-            n = len(x)
-            sum_x = sum(x)
-            sum_y = sum(y)
-            sum_xy = sum(x[i] * y[i] for i in range(n))
-            sum_x2 = sum(x[i] * x[i] for i in range(n))
-            
-            if n * sum_x2 - sum_x * sum_x != 0:
-                trend = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-                trend *= self.update_frequency  # Scale to per-second trend
-        
-        return {
-            'current': current,
-            'avg': avg,
-            'max': max_val,
-            'min': min_val,
-            'std_dev': std_dev,
-            'range': range_val,
-            'trend': trend
-        }
+        if data_key not in self.rolling_stats.index or self.rolling_stats.count < 2:
+            return dict.fromkeys(STAT_FIELDS, 0)
+        
+        return self.rolling_stats.stream_summary(data_key, self.update_frequency)
     
     def get_ems_mode_description(self, mode_value):
         """Get human-readable EMS mode description."""
@@ -106,11 +332,9 @@ class EnhancedSungrowMonitor:
         }
         return mode_map.get(mode_value, f"Unknown ({mode_value})")
     
-    def display_thermodynamic_balance(self, stats):
-        """Display thermodynamically correct energy balance equation with clear sign conventions."""
-        print("\n" + "="*80)
-        print("🌡️  THERMODYNAMIC ENERGY BALANCE - SITE BOUNDARY")
-        print("="*80)
+    def render_thermodynamic_balance(self, stats):
+        """Render thermodynamically correct energy balance equation with clear sign conventions."""
+        lines = [self._THERMO_TITLE]
         
         # Site boundary components with clear sign conventions
         P_sun = stats['solar_power']['current']          # Always positive (generation)
@@ -121,79 +345,52 @@ class EnhancedSungrowMonitor:
         # Rearranged: P_load = P_sun - P_batt - P_grid
         P_load = P_sun - P_batt - P_grid
         
-        print(f"📊 SIGN CONVENTIONS:")
-        print(f"   P_sun  > 0: Solar generation     | P_batt > 0: Battery charging")
-        print(f"   P_grid > 0: Grid export          | P_batt < 0: Battery discharging") 
-        print(f"   P_grid < 0: Grid import          | P_load > 0: House consumption")
-        
-        print(f"\n⚖️  FUNDAMENTAL ENERGY BALANCE:")
-        print(f"   P_grid = P_sun - P_load - P_batt")
+        lines.append(self._SIGN_LEGEND)
         
         # Show with actual values and clear signs
         batt_sign = "+" if P_batt >= 0 else ""
         grid_sign = "+" if P_grid >= 0 else ""
         load_sign = "+" if P_load >= 0 else ""
         
-        print(f"   {grid_sign}{self.format_power(P_grid)} = {self.format_power(P_sun)} - {self.format_power(P_load)} - ({batt_sign}{self.format_power(P_batt)})")
+        lines.append(f"   {grid_sign}{self.format_power(P_grid)} = {self.format_power(P_sun)} - {self.format_power(P_load)} - ({batt_sign}{self.format_power(P_batt)})")
         
         # Verification
         calculated_grid = P_sun - P_load - P_batt
         balance_error = abs(P_grid - calculated_grid)
         
-        print(f"   Verification: {self.format_power(P_grid)} ≈ {self.format_power(calculated_grid)} (Error: {self.format_power(balance_error)})")
+        lines.append(f"   Verification: {self.format_power(P_grid)} ≈ {self.format_power(calculated_grid)} (Error: {self.format_power(balance_error)})")
         
         # Energy flows with clear descriptions
-        print(f"\n🔄 ENERGY FLOWS:")
-        print(f"   🌞 Solar Generation:    {self.format_power(P_sun):>10}")
-        print(f"   🏠 House Consumption:   {self.format_power(P_load):>10}")
+        lines.append(f"\n🔄 ENERGY FLOWS:")
+        lines.append(f"   🌞 Solar Generation:    {self.format_power(P_sun):>10}")
+        lines.append(f"   🏠 House Consumption:   {self.format_power(P_load):>10}")
         
         # Battery status with clear direction
-        if P_batt > 10:
-            batt_status = f"Charging at {self.format_power(P_batt)}"
-        elif P_batt < -10:
-            batt_status = f"Discharging at {self.format_power(-P_batt)}"
-        else:
-            batt_status = "Idle"
-        print(f"   🔋 Battery Flow:        {self.format_power(P_batt):>10} ({batt_status})")
+        batt_status = self._BATTERY_STATUS[_flow_direction(P_batt)].format(self.format_power(abs(P_batt)))
+        lines.append(f"   🔋 Battery Flow:        {self.format_power(P_batt):>10} ({batt_status})")
         
         # Grid status with clear direction
-        if P_grid > 10:
-            grid_status = f"Exporting {self.format_power(P_grid)}"
-        elif P_grid < -10:
-            grid_status = f"Importing {self.format_power(-P_grid)}"
-        else:
-            grid_status = "Balanced"
-        print(f"   ⚡ Grid Flow:           {self.format_power(P_grid):>10} ({grid_status})")
+        grid_status = self._GRID_STATUS[_flow_direction(P_grid)].format(self.format_power(abs(P_grid)))
+        lines.append(f"   ⚡ Grid Flow:           {self.format_power(P_grid):>10} ({grid_status})")
         
         # Efficiency metrics
         if P_sun > 0:
             grid_export = max(0, P_grid)
             self_consumption_ratio = min(100, (P_sun - grid_export) / P_sun * 100)
-            print(f"   📈 Self-Consumption:    {self_consumption_ratio:>9.1f}%")
+            lines.append(f"   📈 Self-Consumption:    {self_consumption_ratio:>9.1f}%")
         
         if P_load > 0:
             solar_coverage = min(100, P_sun / P_load * 100)
-            print(f"   ☀️ Solar Coverage:      {solar_coverage:>9.1f}%")
-    
-    def display_enhanced_statistics_table(self, stats, system_info):
-        """Display enhanced statistics table with comprehensive metrics."""
-        print("\n" + "="*120)
-        print("📊 COMPREHENSIVE SYSTEM STATISTICS")
-        print("="*120)
+            lines.append(f"   ☀️ Solar Coverage:      {solar_coverage:>9.1f}%")
         
-        # Header
-        print(f"│ {'Parameter':<20} │ {'Current':<12} │ {'Average':<12} │ {'Max':<12} │ {'Min':<12} │ {'Std Dev':<10} │ {'Range':<12} │ {'Trend/s':<10} │")
-        print("├" + "─"*21 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*11 + "┼" + "─"*13 + "┼" + "─"*11 + "┤")
+        return "\n".join(lines)
+    
+    def render_enhanced_statistics_table(self, stats, system_info):
+        """Render enhanced statistics table with comprehensive metrics."""
+        lines = [self._TABLE_TITLE, self._TABLE_HEADER, self._SEP_MID]
         
         # Power parameters
-        power_params = [
-            ('Solar Power', 'solar_power', 'W'),
-            ('Battery Power', 'battery_power', 'W'),
-            ('Grid Power', 'grid_power', 'W'),
-            ('House Load', 'house_load', 'W'),
-        ]
-        
-        for name, key, unit in power_params:
+        for name, key, unit in self.POWER_PARAMS:
             s = stats.get(key, {})
             current = s.get('current', 0)
             avg = s.get('avg', 0)
@@ -203,18 +400,12 @@ class EnhancedSungrowMonitor:
             range_val = s.get('range', 0)
             trend = s.get('trend', 0)
             
-            print(f"│ {name:<20} │ {self.format_power(current):>11} │ {self.format_power(avg):>11} │ {self.format_power(max_val):>11} │ {self.format_power(min_val):>11} │ {std_dev:>9.1f}W │ {self.format_power(range_val):>11} │ {trend:>+9.1f}W │")
+            lines.append(f"│ {name:<20} │ {self.format_power(current):>11} │ {self.format_power(avg):>11} │ {self.format_power(max_val):>11} │ {self.format_power(min_val):>11} │ {std_dev:>9.1f}W │ {self.format_power(range_val):>11} │ {trend:>+9.1f}W │")
         
-        print("├" + "─"*21 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*13 + "┼" + "─"*11 + "┼" + "─"*13 + "┼" + "─"*11 + "┤")
+        lines.append(self._SEP_MID)
         
         # System parameters
-        system_params = [
-            ('Battery SOC', 'battery_soc', '%'),
-            ('Grid Frequency', 'grid_frequency', 'Hz'),
-            ('Inverter Temp', 'inverter_temp', '°C'),
-        ]
-        
-        for name, key, unit in system_params:
+        for name, key, unit in self.SYSTEM_PARAMS:
             s = stats.get(key, {})
             current = s.get('current', 0)
             avg = s.get('avg', 0)
@@ -225,111 +416,137 @@ class EnhancedSungrowMonitor:
             trend = s.get('trend', 0)
             
             if unit == '%':
-                print(f"│ {name:<20} │ {current:>10.1f}% │ {avg:>10.1f}% │ {max_val:>10.1f}% │ {min_val:>10.1f}% │ {std_dev:>9.2f}% │ {range_val:>10.1f}% │ {trend:>+8.3f}%/s │")
+                lines.append(f"│ {name:<20} │ {current:>10.1f}% │ {avg:>10.1f}% │ {max_val:>10.1f}% │ {min_val:>10.1f}% │ {std_dev:>9.2f}% │ {range_val:>10.1f}% │ {trend:>+8.3f}%/s │")
             elif unit == 'Hz':
-                print(f"│ {name:<20} │ {current:>10.2f}Hz │ {avg:>10.2f}Hz │ {max_val:>10.2f}Hz │ {min_val:>10.2f}Hz │ {std_dev:>8.3f}Hz │ {range_val:>10.3f}Hz │ {trend:>+7.4f}Hz/s │")
+                lines.append(f"│ {name:<20} │ {current:>10.2f}Hz │ {avg:>10.2f}Hz │ {max_val:>10.2f}Hz │ {min_val:>10.2f}Hz │ {std_dev:>8.3f}Hz │ {range_val:>10.3f}Hz │ {trend:>+7.4f}Hz/s │")
             elif unit == '°C':
-                print(f"│ {name:<20} │ {current:>10.1f}°C │ {avg:>10.1f}°C │ {max_val:>10.1f}°C │ {min_val:>10.1f}°C │ {std_dev:>8.2f}°C │ {range_val:>10.1f}°C │ {trend:>+7.3f}°C/s │")
+                lines.append(f"│ {name:<20} │ {current:>10.1f}°C │ {avg:>10.1f}°C │ {max_val:>10.1f}°C │ {min_val:>10.1f}°C │ {std_dev:>8.2f}°C │ {range_val:>10.1f}°C │ {trend:>+7.3f}°C/s │")
         
-        print("└" + "─"*21 + "┴" + "─"*13 + "┴" + "─"*13 + "┴" + "─"*13 + "┴" + "─"*13 + "┴" + "─"*11 + "┴" + "─"*13 + "┴" + "─"*11 + "┘")
+        lines.append(self._SEP_BOTTOM)
         
         # System status
-        print(f"\n🎛️  SYSTEM STATUS:")
+        lines.append(f"\n🎛️  SYSTEM STATUS:")
         ems_mode = system_info.get('ems_mode', 0)
         ems_description = self.get_ems_mode_description(ems_mode)
-        print(f"   • EMS Mode: {ems_description}")
-        print(f"   • System State: {system_info.get('system_state', 'Unknown')}")
-        print(f"   • Running State: {system_info.get('running_state', 'Unknown')}")
-        print(f"   • Update Rate: {1/self.update_interval:.1f} Hz")
-        print(f"   • Data Points: {len(self.data_history.get('solar_power', []))}/300 (last 30s)")
+        lines.append(f"   • EMS Mode: {ems_description}")
+        lines.append(f"   • System State: {system_info.get('system_state', 'Unknown')}")
+        lines.append(f"   • Running State: {system_info.get('running_state', 'Unknown')}")
+        lines.append(f"   • Update Rate: {1/self.update_interval:.1f} Hz ({self.late_updates} late)")
+        lines.append(f"   • Data Points: {self.rolling_stats.count}/{self.stats_window} "
+                     f"(last {self.stats_window / self.update_frequency:.0f}s)")
+        
+        return "\n".join(lines)
+    
+    def read_current_data(self):
+        """Read the inverter and flatten the values shown by the monitor (blocking)."""
+        self.controller.update()
+        nested_data = self.controller.get_current_state()
+        
+        # Flatten; get_current_state() always populates every key used here
+        solar, battery, grid, frequency, temperature = _POWER_FIELDS(nested_data['power'])
+        ems_mode, system_state, running_state = _SYSTEM_FIELDS(nested_data['system'])
+        current_data = {
+            'solar_power': solar,
+            'battery_power': battery,  # + = charging, - = discharging
+            'grid_power': grid,  # + = import, - = export
+            'battery_soc': nested_data['battery']['level'],
+            'grid_frequency': frequency,
+            'inverter_temp': temperature,
+            'ems_mode': ems_mode,
+            'system_state': system_state,
+            'running_state': running_state,
+        }
+        
+        # House load from the energy balance: solar + grid import - battery charge
+        # (grid: + = import, battery: + = charging; the signed terms cover both directions)
+        current_data['house_load'] = (current_data['solar_power'] + current_data['grid_power']
+                                      - current_data['battery_power'])
+        
+        return current_data
+    
+    def record(self, current_data):
+        """Add a reading to the rolling window and return statistics for all parameters."""
+        self.rolling_stats.append([current_data[key] for key in self.STAT_KEYS])
+        
+        return self.rolling_stats.summary(self.update_frequency)
+    
+    def display(self, current_data, stats):
+        """Draw one frame with a single write to the terminal."""
+        system_info = {
+            'ems_mode': current_data['ems_mode'],
+            'system_state': current_data['system_state'],
+            'running_state': current_data['running_state']
+        }
+        frame = "\n".join([
+            "🏠 ENHANCED SUNGROW MONITOR - THERMODYNAMIC ANALYSIS",
+            f"⏰ {time.strftime('%Y-%m-%d %H:%M:%S')} | Update Rate: {1/self.update_interval:.1f} Hz",
+            self.render_thermodynamic_balance(stats),
+            self.render_enhanced_statistics_table(stats, system_info),
+        ])
+        write_frame(frame)
+    
+    async def poll_task(self):
+        """
+        Producer task: read the inverter at update_frequency and publish the latest
+        reading. The blocking Modbus I/O runs in the default executor so the event
+        loop (and the display task) stays responsive.
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = time.monotonic()
+        while self.running:
+            current_data = await loop.run_in_executor(None, self.read_current_data)
+            stats = self.record(current_data)
+            
+            # Keep only the newest frame; the display never renders stale data
+            if self.snapshot_queue.full():
+                self.snapshot_queue.get_nowait()
+            self.snapshot_queue.put_nowait((current_data, stats))
+            
+            # Maintain update frequency against absolute monotonic deadlines, so sleep
+            # jitter does not accumulate and wall-clock (NTP) steps cannot stall the loop.
+            # A read that overruns its slot re-anchors the schedule instead of bursting.
+            next_tick += self.update_interval
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time < 0:
+                self.late_updates += 1
+                next_tick = time.monotonic()
+                sleep_time = 0
+            await asyncio.sleep(sleep_time)
+    
+    async def display_task(self):
+        """Consumer task: draw each new reading as soon as it is published."""
+        while self.running:
+            current_data, stats = await self.snapshot_queue.get()
+            self.display(current_data, stats)
     
-    def run(self):
+    async def run(self):
         """Main monitoring loop with enhanced statistics."""
-        if not self.controller.connect():
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(None, self.controller.connect):
             print("❌ Failed to connect to Sungrow inverter")
             return
         
         print(f"🔌 Connected to Sungrow inverter. Starting enhanced monitoring at {1/self.update_interval:.1f} Hz...")
-        time.sleep(1)
+        await asyncio.sleep(1)
         
         self.running = True
+        self.snapshot_queue = asyncio.Queue(maxsize=1)
+        producer = asyncio.create_task(self.poll_task())
+        consumer = asyncio.create_task(self.display_task())
         
         try:
-            while self.running:
-                start_time = time.time()
-                
-                # Read current data
-                self.controller.update()
-                nested_data = self.controller.get_current_state()
-                
-                # Flatten and calculate derived values
-                current_data = {
-                    'solar_power': nested_data['power'].get('solar_power', 0),
-                    'battery_power': nested_data['power'].get('battery_power', 0),  # + = charging, - = discharging
-                    'grid_power': nested_data['power'].get('grid_power', 0),  # + = import, - = export
-                    'battery_soc': nested_data['battery'].get('level', 0),
-                    'grid_frequency': nested_data['power'].get('grid_frequency', 0),
-                    'inverter_temp': nested_data['power'].get('inverter_temperature', 0),
-                    'ems_mode': nested_data['system'].get('ems_mode', 0),
-                    'system_state': nested_data['system'].get('system_state', 'Unknown'),
-                    'running_state': nested_data['system'].get('running_state', 0),
-                }
-                
-                # Calculate house load from energy balance
-                solar = current_data['solar_power']
-                grid = current_data['grid_power']
-                battery = current_data['battery_power']
-                
-                grid_import = max(0, grid)
-                grid_export = max(0, -grid)
-                battery_charge = max(0, battery)
-                battery_discharge = max(0, -battery)
-                
-                house_load = solar + grid_import - battery_charge + battery_discharge - grid_export
-                current_data['house_load'] = house_load
-                
-                # Store data in history
-                timestamp = time.time()
-                for key, value in current_data.items():
-                    if isinstance(value, (int, float)):
-                        self.data_history[key].append(value)
-                        self.long_history[key].append((timestamp, value))
-                
-                # Calculate statistics for all parameters
-                stats = {}
-                for key in ['solar_power', 'battery_power', 'grid_power', 'house_load', 
-                           'battery_soc', 'grid_frequency', 'inverter_temp']:
-                    stats[key] = self.calculate_statistics(key)
-                
-                # Clear screen and display
-                os.system('clear' if os.name == 'posix' else 'cls')
-                
-                print("🏠 ENHANCED SUNGROW MONITOR - THERMODYNAMIC ANALYSIS")
-                print(f"⏰ {time.strftime('%Y-%m-%d %H:%M:%S')} | Update Rate: {1/self.update_interval:.1f} Hz")
-                
-                # Display thermodynamic balance
-                self.display_thermodynamic_balance(stats)
-                
-                # Display enhanced statistics table
-                system_info = {
-                    'ems_mode': current_data['ems_mode'],
-                    'system_state': current_data['system_state'],
-                    'running_state': current_data['running_state']
-                }
-                self.display_enhanced_statistics_table(stats, system_info)
-                
-                # Maintain update frequency
-                elapsed = time.time() - start_time
-                sleep_time = max(0, self.update_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                
-        except KeyboardInterrupt:
-            print("\n🛑 Monitoring stopped by user")
+            # Stop as soon as either task ends; result() re-raises the first failure
+            done, _ = await asyncio.wait((producer, consumer), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
         except Exception as e:
             print(f"\n❌ Error during monitoring: {e}")
         finally:
-            self.controller.disconnect()
+            self.running = False
+            for task in (producer, consumer):
+                task.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+            await loop.run_in_executor(None, self.controller.disconnect)
             print("🔌 Disconnected from inverter")
 
 
@@ -340,7 +557,10 @@ def main():
     print("=" * 60)
     
     monitor = EnhancedSungrowMonitor(update_frequency=2.0)  # 2 Hz - realistic for Modbus
-    monitor.run()
+    try:
+        asyncio.run(monitor.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Monitoring stopped by user")
 
 
 if __name__ == "__main__":
@@ -6,12 +6,13 @@ Producer-Consumer architecture without Rich Live (which was causing hanging)
 
 import asyncio
 import signal
-import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from telemetry import TelemetryCollector, create_telemetry_system
 from analysis import AnalysisSnapshot, analyze_from_collector
+from monitor import write_frame
 
 
 class SimpleEnergyMonitor:
@@ -24,6 +25,7 @@ class SimpleEnergyMonitor:
         self.collector = telemetry_collector
         self.running = False
         self.current_snapshot: Optional[AnalysisSnapshot] = None
+        self._snapshot_ready = asyncio.Event()  # set by the producer on each new snapshot
         
         # UI refresh rate (2fps = 500ms intervals)
         self.ui_refresh_interval = 0.5  # seconds
@@ -37,8 +39,10 @@ class SimpleEnergyMonitor:
         print("\n🛑 Shutdown signal received. Stopping monitor...")
         self.running = False
     
-    def format_power(self, watts: float) -> str:
-        """Format power values with appropriate units."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_power(watts: float) -> str:
+        """Format power values with appropriate units (memoised, readings repeat across frames)."""
         if abs(watts) >= 1_000_000:
             return f"{watts/1_000_000:.2f} MW"
         elif abs(watts) >= 1000:
@@ -53,15 +57,21 @@ class SimpleEnergyMonitor:
     async def snapshot_producer_task(self):
         """
         Producer task: Generate analysis snapshots from telemetry data.
-        Runs independently of UI refresh rate.
+        Runs independently of UI refresh rate. A new snapshot is only produced (and
+        rendered) when the collector has buffered new samples since the last one.
         """
+        analysed_sample_count = None
         while self.running:
             try:
-                # Generate analysis snapshot from current telemetry data
-                snapshot = analyze_from_collector(self.collector, datetime.now())
-                
-                # Update current snapshot (thread-safe assignment)
-                self.current_snapshot = snapshot
+                sample_count = self.collector.sample_count
+                if sample_count != analysed_sample_count:
+                    # Generate analysis snapshot from current telemetry data
+                    snapshot = analyze_from_collector(self.collector, datetime.now())
+                    analysed_sample_count = sample_count
+                    
+                    # Publish the snapshot and wake the UI consumer
+                    self.current_snapshot = snapshot
+                    self._snapshot_ready.set()
                 
                 # Sleep for a bit to avoid excessive CPU usage
                 await asyncio.sleep(0.5)  # 2Hz snapshot generation
@@ -74,16 +84,15 @@ class SimpleEnergyMonitor:
     def display_snapshot(self, snapshot: AnalysisSnapshot):
         """
         Display snapshot using simple console output.
+        The frame is built up as a list of lines and written in one go.
         """
-        # Clear screen
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-        print("🏠 ENERGY MANAGEMENT SYSTEM - PRODUCER-CONSUMER ARCHITECTURE")
-        print("=" * 80)
-        print(f"📅 {snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"📊 Analysis Window: {snapshot.analysis_window_seconds}s with {snapshot.sample_count} samples")
-        print(f"🎯 Data Quality: {self.format_percentage(snapshot.data_quality_score)}")
-        print(f"⭐ System Stability: {snapshot.system_stability_index:.3f}")
+        lines = []
+        lines.append("🏠 ENERGY MANAGEMENT SYSTEM - PRODUCER-CONSUMER ARCHITECTURE")
+        lines.append("=" * 80)
+        lines.append(f"📅 {snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"📊 Analysis Window: {snapshot.analysis_window_seconds}s with {snapshot.sample_count} samples")
+        lines.append(f"🎯 Data Quality: {self.format_percentage(snapshot.data_quality_score)}")
+        lines.append(f"⭐ System Stability: {snapshot.system_stability_index:.3f}")
         
         # System operating mode
         ratios = snapshot.energy_ratios
@@ -94,23 +103,23 @@ class SimpleEnergyMonitor:
         if ratios.battery_active: modes.append("🔋 BATTERY-ACTIVE")
         
         primary_mode = " + ".join(modes) if modes else "⚪ STANDBY"
-        print(f"🚦 Operating Mode: {primary_mode}")
+        lines.append(f"🚦 Operating Mode: {primary_mode}")
         
         # Energy balance with thermodynamic equation
-        print("\n⚖️ ENERGY BALANCE - THERMODYNAMIC EQUATION")
-        print("-" * 50)
+        lines.append("\n⚖️ ENERGY BALANCE - THERMODYNAMIC EQUATION")
+        lines.append("-" * 50)
         balance = snapshot.energy_balance
-        print(f"P_solar + P_grid = P_load + P_battery")
-        print(f"[Generation: NEGATIVE, Load: POSITIVE]")
-        print(f"{self.format_power(balance.solar_power)} + {self.format_power(balance.grid_power)} = {self.format_power(balance.load_power)} + {self.format_power(balance.battery_power)}")
+        lines.append(f"P_solar + P_grid = P_load + P_battery")
+        lines.append(f"[Generation: NEGATIVE, Load: POSITIVE]")
+        lines.append(f"{self.format_power(balance.solar_power)} + {self.format_power(balance.grid_power)} = {self.format_power(balance.load_power)} + {self.format_power(balance.battery_power)}")
         
         left_side = balance.solar_power + balance.grid_power
         right_side = balance.load_power + balance.battery_power
-        print(f"{self.format_power(left_side)} = {self.format_power(right_side)}")
-        print(f"Balance Error: {self.format_power(balance.balance_error)} {'✅' if balance.balance_valid else '❌'}")
+        lines.append(f"{self.format_power(left_side)} = {self.format_power(right_side)}")
+        lines.append(f"Balance Error: {self.format_power(balance.balance_error)} {'✅' if balance.balance_valid else '❌'}")
         
         # Show actual generation amount (positive for clarity)
-        print(f"Solar Generation: {self.format_power(-balance.solar_power)} (shown as negative: {self.format_power(balance.solar_power)})")
+        lines.append(f"Solar Generation: {self.format_power(-balance.solar_power)} (shown as negative: {self.format_power(balance.solar_power)})")
         
         # Energy flow status
         if balance.grid_importing:
@@ -127,17 +136,17 @@ class SimpleEnergyMonitor:
         else:
             battery_status = "🔋⏸️ Battery Idle"
         
-        print(f"Energy Flow: {grid_status}  |  {battery_status}")
+        lines.append(f"Energy Flow: {grid_status}  |  {battery_status}")
         
         # Power stream analysis
-        print("\n⚡ POWER STREAM ANALYSIS")
-        print("-" * 80)
+        lines.append("\n⚡ POWER STREAM ANALYSIS")
+        lines.append("-" * 80)
         
         def display_power_stream(name: str, emoji: str, stats, trend_suffix: str = "W/s"):
             trend_indicator = "📈" if stats.first_derivative > 0 else "📉" if stats.first_derivative < 0 else "➡️"
             oscillation_indicator = "🔴" if stats.oscillation_index > 0.2 else "🟡" if stats.oscillation_index > 0.1 else "🟢"
             
-            print(f"{emoji} {name:15} Current: {self.format_power(stats.current):>8}  |  "
+            lines.append(f"{emoji} {name:15} Current: {self.format_power(stats.current):>8}  |  "
                   f"Avg: {self.format_power(stats.mean):>8}  |  "
                   f"Trend: {trend_indicator} {stats.first_derivative:+.1f} {trend_suffix}  |  "
                   f"Stability: {oscillation_indicator} {stats.oscillation_index:.3f}")
@@ -148,22 +157,24 @@ class SimpleEnergyMonitor:
         display_power_stream("Load", "🏠", snapshot.load_stats)
         
         # Energy efficiency metrics
-        print("\n📊 ENERGY EFFICIENCY METRICS")
-        print("-" * 50)
-        print(f"🎯 Self-Consumption:    {self.format_percentage(ratios.self_consumption_ratio):>8}")
-        print(f"☀️ Solar Coverage:      {self.format_percentage(ratios.solar_coverage_ratio):>8}")
-        print(f"🔋 Battery Utilization: {self.format_percentage(ratios.battery_utilization_ratio):>8}")
-        print(f"🏭 Grid Dependency:     {self.format_percentage(ratios.grid_dependency_ratio):>8}")
+        lines.append("\n📊 ENERGY EFFICIENCY METRICS")
+        lines.append("-" * 50)
+        lines.append(f"🎯 Self-Consumption:    {self.format_percentage(ratios.self_consumption_ratio):>8}")
+        lines.append(f"☀️ Solar Coverage:      {self.format_percentage(ratios.solar_coverage_ratio):>8}")
+        lines.append(f"🔋 Battery Utilization: {self.format_percentage(ratios.battery_utilization_ratio):>8}")
+        lines.append(f"🏭 Grid Dependency:     {self.format_percentage(ratios.grid_dependency_ratio):>8}")
         
         # Producer-consumer info
-        print(f"\n📡 SYSTEM INFO")
-        print("-" * 30)
+        lines.append(f"\n📡 SYSTEM INFO")
+        lines.append("-" * 30)
         buffer_info = self.collector.get_buffer_info()
         collector_stats = self.collector.get_stats()
-        print(f"Data Collection: {buffer_info['sample_rate']:.1f} Hz")
-        print(f"UI Updates: {1/self.ui_refresh_interval:.1f} fps")
-        print(f"Queue: {collector_stats['queue_size']}/{collector_stats['queue_maxsize']}")
-        print(f"Ring Buffer: {buffer_info['short_buffer_lengths'].get('solar_power', 0)}/{buffer_info['short_buffer_size']}")
+        lines.append(f"Data Collection: {buffer_info['sample_rate']:.1f} Hz")
+        lines.append(f"UI Updates: {1/self.ui_refresh_interval:.1f} fps")
+        lines.append(f"Queue: {collector_stats['queue_size']}/{collector_stats['queue_maxsize']}")
+        lines.append(f"Ring Buffer: {buffer_info['short_buffer_lengths'].get('solar_power', 0)}/{buffer_info['short_buffer_size']}")
+        
+        write_frame("\n".join(lines))
     
     async def run_monitor(self):
         """
@@ -181,15 +192,17 @@ class SimpleEnergyMonitor:
         producer_task = asyncio.create_task(self.snapshot_producer_task())
         
         try:
-            # Consumer loop: Update UI at specified rate
+            # Consumer loop: render each new snapshot as soon as it is published
             while self.running:
-                if self.current_snapshot is not None:
-                    self.display_snapshot(self.current_snapshot)
-                else:
-                    print("🔄 Initializing Energy Management System...")
+                try:
+                    await asyncio.wait_for(self._snapshot_ready.wait(), timeout=self.ui_refresh_interval)
+                except asyncio.TimeoutError:
+                    if self.current_snapshot is None:
+                        print("🔄 Initializing Energy Management System...")
+                    continue
                 
-                # Sleep for UI refresh interval
-                await asyncio.sleep(self.ui_refresh_interval)
+                self._snapshot_ready.clear()
+                self.display_snapshot(self.current_snapshot)
                 
         except KeyboardInterrupt:
             print("\n🛑 Keyboard interrupt received")
@@ -6,12 +6,77 @@ Handles battery, solar, and grid power management.
 from modbus_client import SungrowModbusClient
 import logging
 import time
+from array import array
+from operator import attrgetter
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Every register SungrowController.update() needs, fetched in a single
+# read_multiple_registers() call per cycle
+UPDATE_REGISTERS = (
+    # Power
+    'total_dc_power', 'total_active_power', 'load_power', 'export_power_raw',
+    'battery_power_raw', 'grid_frequency', 'inverter_temperature',
+    'phase_a_voltage', 'phase_b_voltage', 'phase_c_voltage',
+    'phase_a_current', 'phase_b_current', 'phase_c_current',
+    # Battery
+    'battery_level', 'battery_voltage', 'battery_current', 'battery_temperature',
+    'battery_state_of_health', 'battery_capacity',
+    # Energy
+    'daily_pv_generation', 'total_pv_generation',
+    'daily_imported_energy', 'total_imported_energy',
+    'daily_exported_energy', 'total_exported_energy',
+    'daily_battery_charge', 'total_battery_charge',
+    'daily_battery_discharge', 'total_battery_discharge',
+    # System
+    'system_state', 'running_state',
+    'ems_mode_selection', 'min_soc', 'max_soc',
+    'export_power_limit', 'export_power_limit_mode',
+)
+
+# Hardware identity, read along with UPDATE_REGISTERS until it has been loaded once
+STATIC_REGISTERS = ('inverter_serial', 'device_type_code')
+_FULL_UPDATE_REGISTERS = UPDATE_REGISTERS + STATIC_REGISTERS
+
+# Numeric values of get_current_state(), flattened in get_state_array() order as
+# (name, controller attribute path). Flags are stored as 1.0/0.0 and the system
+# state as its code rather than its text.
+STATE_FIELDS = (
+    ('power.solar_power', 'power_data.solar_power'),
+    ('power.grid_power', 'power_data.grid_power'),
+    ('power.load_power', 'power_data.load_power'),
+    ('power.battery_power', 'power_data.battery_power'),
+    ('power.total_power', 'power_data.total_power'),
+    ('power.grid_frequency', 'power_data.grid_frequency'),
+    ('power.inverter_temperature', 'power_data.inverter_temperature'),
+    ('battery.level', 'battery_data.level'),
+    ('battery.voltage', 'battery_data.voltage'),
+    ('battery.current', 'battery_data.current'),
+    ('battery.power', 'battery_data.power'),
+    ('battery.temperature', 'battery_data.temperature'),
+    ('battery.state_of_health', 'battery_data.state_of_health'),
+    ('battery.capacity', 'battery_data.capacity'),
+    ('battery.is_charging', 'battery_data.is_charging'),
+    ('battery.is_discharging', 'battery_data.is_discharging'),
+    ('energy.daily_pv_generation', 'energy_data.daily_pv_generation'),
+    ('energy.daily_imported_energy', 'energy_data.daily_imported_energy'),
+    ('energy.daily_exported_energy', 'energy_data.daily_exported_energy'),
+    ('energy.daily_battery_charge', 'energy_data.daily_battery_charge'),
+    ('energy.daily_battery_discharge', 'energy_data.daily_battery_discharge'),
+    ('system.system_state', 'system_info.system_state'),
+    ('system.running_state', 'system_info.running_state'),
+    ('system.ems_mode', 'system_info.ems_mode'),
+    ('system.min_soc', 'system_info.min_soc'),
+    ('system.max_soc', 'system_info.max_soc'),
+    ('system.export_power_limit', 'system_info.export_power_limit'),
+    ('system.export_power_limit_enabled', 'system_info.export_power_limit_enabled'),
+)
+STATE_FIELD_NAMES = tuple(name for name, _ in STATE_FIELDS)
+_STATE_VALUES = attrgetter(*(path for _, path in STATE_FIELDS))
+
 
 class EMSMode(Enum):
     """EMS operating modes."""
@@ -64,7 +129,13 @@ class SystemState(Enum):
     WARN_RUNNING = 0x9100
 
 
-@dataclass
+# Display text per state code, so the poll path is a single dict lookup
+_SYSTEM_STATE_TEXT = {state.value: state.name.replace('_', ' ').title() for state in SystemState}
+# INITIAL_STANDBY_ALT is documented as 0x1200; 0x12000 does not fit the 16-bit register
+_SYSTEM_STATE_TEXT[0x1200] = _SYSTEM_STATE_TEXT[SystemState.INITIAL_STANDBY_ALT.value]
+
+
+@dataclass(slots=True)
 class PowerData:
     """Power measurements data structure."""
     solar_power: float = 0.0      # DC power from solar panels (W)
@@ -86,7 +157,7 @@ class PowerData:
     inverter_temperature: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryData:
     """Battery data structure."""
     level: float = 0.0            # SOC (%)
@@ -102,7 +173,7 @@ class BatteryData:
     is_discharging: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergyData:
     """Energy counters data structure."""
     # Daily counters
@@ -120,7 +191,7 @@ class EnergyData:
     total_battery_discharge: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     """System information data structure."""
     inverter_serial: str = ""
@@ -143,6 +214,54 @@ class SungrowController:
     from the Home Assistant integration.
     """
     
+    # (dataclass attribute, register name, default when the read failed) for the
+    # values that are copied straight from the registers
+    _POWER_FIELDS = (
+        ('load_power', 'load_power', 0.0),
+        ('battery_power', 'battery_power_raw', 0.0),
+        ('grid_frequency', 'grid_frequency', 0.0),
+        ('inverter_temperature', 'inverter_temperature', 0.0),
+        ('phase_a_voltage', 'phase_a_voltage', 0.0),
+        ('phase_b_voltage', 'phase_b_voltage', 0.0),
+        ('phase_c_voltage', 'phase_c_voltage', 0.0),
+        ('phase_a_current', 'phase_a_current', 0.0),
+        ('phase_b_current', 'phase_b_current', 0.0),
+        ('phase_c_current', 'phase_c_current', 0.0),
+    )
+    _BATTERY_FIELDS = (
+        ('level', 'battery_level', 0.0),
+        ('voltage', 'battery_voltage', 0.0),
+        ('current', 'battery_current', 0.0),
+        ('power', 'battery_power_raw', 0.0),
+        ('temperature', 'battery_temperature', 0.0),
+        ('state_of_health', 'battery_state_of_health', 0.0),
+        ('capacity', 'battery_capacity', 0.0),
+    )
+    _ENERGY_FIELDS = tuple((name, name, 0.0) for name in (
+        'daily_pv_generation', 'daily_imported_energy', 'daily_exported_energy',
+        'daily_battery_charge', 'daily_battery_discharge',
+        'total_pv_generation', 'total_imported_energy', 'total_exported_energy',
+        'total_battery_charge', 'total_battery_discharge',
+    ))
+    _STATIC_FIELDS = (
+        ('inverter_serial', 'inverter_serial', ''),
+        ('device_type_code', 'device_type_code', 0),
+    )
+    _SYSTEM_FIELDS = (
+        ('system_state', 'system_state', 0),
+        ('running_state', 'running_state', 0),
+        ('ems_mode', 'ems_mode_selection', 0),
+        ('min_soc', 'min_soc', 0.0),
+        ('max_soc', 'max_soc', 0.0),
+        ('export_power_limit', 'export_power_limit', 0),
+    )
+    
+    # (is_charging, is_discharging) indexed by running_state bits 1-2
+    # (bit 1: charging, bit 2: discharging)
+    _CHARGE_FLAGS = ((False, False), (True, False), (False, True), (True, True))
+    
+    _RECONNECT_BACKOFF_MAX = 30.0  # seconds between reconnect attempts, at most
+    
     def __init__(self, config_file: str = "config.yaml"):
         """Initialize the Sungrow controller."""
         self.client = SungrowModbusClient(config_file)
@@ -160,203 +279,277 @@ class SungrowController:
         self.energy_data = EnergyData()
         self.system_info = SystemInfo()
         
+        # get_current_state() result, rebuilt only after a successful update()
+        self._update_generation = 0
+        self._state_cache = None
+        self._state_cache_stamp = -1
+        self._state_array = None
+        self._state_array_stamp = -1
+        
+        # Serial number and device type only need reading once
+        self._static_info_loaded = False
+        
+        # Reconnect backoff after the inverter stops answering
+        self._reconnect_delay = 0.0
+        self._next_reconnect = 0.0
+        
     def connect(self) -> bool:
         """Connect to the Sungrow inverter."""
         self.connected = self.client.connect()
         return self.connected
     
+    async def connect_async(self) -> bool:
+        """Connect the asyncio client used by update_async()."""
+        self.connected = await self.client.connect_async()
+        return self.connected
+    
     def disconnect(self):
         """Disconnect from the Sungrow inverter."""
         self.client.disconnect()
         self.connected = False
     
-    def update(self) -> bool:
-        """Update all data from the inverter."""
+    def update(self, force: bool = False) -> bool:
+        """
+        Update all data from the inverter.
+        
+        Registers are re-read according to their scan_interval in the config: power
+        values every cycle, SOC, temperatures and control settings every few seconds,
+        energy counters, SOH, capacity and the serial number once a minute or less.
+        The rest is served from the client's cache. force=True re-reads everything.
+        
+        If the inverter stops answering, the connection is re-opened once and the
+        read retried; repeated failures back off up to _RECONNECT_BACKOFF_MAX seconds.
+        The previous values are kept (and False returned) while it is unreachable.
+        """
         if not self.connected:
             logger.error("Controller not connected")
             return False
         
         try:
-            # Update all data categories
-            self._update_power_data()
-            self._update_battery_data()
-            self._update_energy_data()
-            self._update_system_info()
+            # One coalesced read per cycle; the client merges neighbouring addresses
+            # into block requests. max_age=0 re-reads everything that has no
+            # scan_interval of its own.
+            max_age = None if force else 0.0
+            register_names = self._update_registers(force)
+            data = self.client.read_multiple_registers(register_names, max_age=max_age)
+            if self.client.connection_lost and self._reconnect():
+                data = self.client.read_multiple_registers(register_names, max_age=max_age)
+            if self.client.connection_lost:
+                self._log_stale_data()
+                return False
             
+            self._apply_update(data)
             return True
             
         except Exception as e:
-            logger.error(f"Error updating data: {e}")
+            logger.error("Error updating data: %s", e)
             return False
     
-    def _update_power_data(self):
-        """Update power measurements with correct sign conventions."""
-        data = self.client.get_power_data()
+    async def update_async(self, force: bool = False) -> bool:
+        """Same as update(), over the asyncio client from connect_async()."""
+        if not self.connected:
+            logger.error("Controller not connected")
+            return False
+        
+        try:
+            data = await self.client.read_multiple_registers_async(self._update_registers(force),
+                                                                   max_age=None if force else 0.0)
+            # The asyncio client reconnects on its own; just keep the previous values
+            if self.client.connection_lost:
+                self._log_stale_data()
+                return False
+            
+            self._apply_update(data)
+            return True
+            
+        except Exception as e:
+            logger.error("Error updating data: %s", e)
+            return False
+    
+    def _update_registers(self, force: bool) -> tuple:
+        """Registers for this update: the static ones only until they have been loaded."""
+        if force or not self._static_info_loaded:
+            return _FULL_UPDATE_REGISTERS
+        return UPDATE_REGISTERS
+    
+    def refresh_static_info(self) -> bool:
+        """Re-read the serial number and device type (e.g. after a firmware update)."""
+        self._static_info_loaded = False
+        self.client.invalidate_cache(list(STATIC_REGISTERS))
+        return self.update()
+    
+    def _reconnect(self) -> bool:
+        """Re-open the connection, backing off exponentially on repeated failures."""
+        now = time.monotonic()
+        if now < self._next_reconnect:
+            return False
+        
+        logger.warning("Inverter not responding, reconnecting")
+        if self.client.reconnect():
+            self._reconnect_delay = 0.0
+            return True
         
+        self._reconnect_delay = min(max(1.0, 2 * self._reconnect_delay), self._RECONNECT_BACKOFF_MAX)
+        self._next_reconnect = now + self._reconnect_delay
+        logger.error("Reconnect failed, next attempt in %.0fs", self._reconnect_delay)
+        return False
+    
+    def _log_stale_data(self):
+        """Report how old the last good data is while the inverter is unreachable."""
+        if self.client.last_read_time is None:
+            logger.error("Inverter not responding, no data read yet")
+        else:
+            age = time.monotonic() - self.client.last_read_time
+            logger.error("Inverter not responding, data is %.0fs old", age)
+    
+    def _apply_update(self, data: Dict[str, Any]):
+        """Update all data categories from one read of UPDATE_REGISTERS (plus STATIC_REGISTERS)."""
+        self._update_power_data(data)
+        self._update_battery_data(data)
+        self._update_energy_data(data)
+        self._update_system_info(data)
+        
+        self._update_generation += 1
+    
+    @staticmethod
+    def _apply_fields(target, data: Dict[str, Any], fields: tuple):
+        """Copy (attribute, register, default) fields from data onto target; missing or None reads get the default."""
+        get = data.get
+        for attribute, register_name, default in fields:
+            value = get(register_name)
+            setattr(target, attribute, default if value is None else value)
+    
+    def _update_power_data(self, data: Dict[str, Any]):
+        """Update power measurements with correct sign conventions."""
         # Apply correct sign conventions at source:
         # - Generation (solar) should be NEGATIVE (energy production)
         # - Load should be POSITIVE (energy consumption)
-        raw_solar = data.get('total_dc_power', 0.0) or 0.0
-        self.power_data.solar_power = -raw_solar if raw_solar > 0 else 0.0  # Convert positive to negative for generation
+        power = self.power_data
+        raw_solar = data.get('total_dc_power')
+        power.solar_power = -raw_solar if raw_solar is not None and raw_solar > 0 else 0.0  # Convert positive to negative for generation
         
         # Total AC power output (generation side, should be negative)  
-        raw_total = data.get('total_active_power', 0.0) or 0.0
-        self.power_data.total_power = -raw_total if raw_total > 0 else raw_total  # Keep negative, convert positive to negative
-        
-        # Load power should be positive (consumption) - keep as-is since it should already be positive
-        raw_load = data.get('load_power', 0.0) or 0.0
-        self.power_data.load_power = raw_load  # Keep original value
+        raw_total = data.get('total_active_power')
+        if raw_total is None:
+            raw_total = 0.0
+        power.total_power = -raw_total if raw_total > 0 else raw_total  # Keep negative, convert positive to negative
         
         # Grid power (export_power_raw: + = export, - = import)
         # Need to invert sign for our convention: + = import, - = export
-        export_power_raw = data.get('export_power_raw', 0.0) or 0.0
-        self.power_data.grid_power = -export_power_raw  # Invert: positive export becomes negative
-        
-        # Battery power (raw value, sign depends on firmware)
-        battery_raw = data.get('battery_power_raw', 0.0) or 0.0
-        self.power_data.battery_power = battery_raw
-        
-        # Get additional measurements
-        system_data = self.client.get_system_info()
-        self.power_data.grid_frequency = system_data.get('grid_frequency', 0.0) or 0.0
-        self.power_data.inverter_temperature = system_data.get('inverter_temperature', 0.0) or 0.0
-        
-        # Phase voltages and currents
-        phase_data = self.client.read_multiple_registers([
-            'phase_a_voltage', 'phase_b_voltage', 'phase_c_voltage',
-            'phase_a_current', 'phase_b_current', 'phase_c_current'
-        ])
-        
-        self.power_data.phase_a_voltage = phase_data.get('phase_a_voltage', 0.0) or 0.0
-        self.power_data.phase_b_voltage = phase_data.get('phase_b_voltage', 0.0) or 0.0
-        self.power_data.phase_c_voltage = phase_data.get('phase_c_voltage', 0.0) or 0.0
-        self.power_data.phase_a_current = phase_data.get('phase_a_current', 0.0) or 0.0
-        self.power_data.phase_b_current = phase_data.get('phase_b_current', 0.0) or 0.0
-        self.power_data.phase_c_current = phase_data.get('phase_c_current', 0.0) or 0.0
-    
-    def _update_battery_data(self):
-        """Update battery measurements."""
-        data = self.client.get_battery_data()
+        export_power_raw = data.get('export_power_raw')
+        power.grid_power = -export_power_raw if export_power_raw else 0.0  # Invert: positive export becomes negative
         
-        self.battery_data.level = data.get('battery_level', 0.0) or 0.0
-        self.battery_data.voltage = data.get('battery_voltage', 0.0) or 0.0
-        self.battery_data.current = data.get('battery_current', 0.0) or 0.0
-        self.battery_data.power = data.get('battery_power_raw', 0.0) or 0.0
-        self.battery_data.temperature = data.get('battery_temperature', 0.0) or 0.0
-        self.battery_data.state_of_health = data.get('battery_state_of_health', 0.0) or 0.0
-        self.battery_data.capacity = data.get('battery_capacity', 0.0) or 0.0
+        # Load (kept as-is, already positive), battery power (raw value, sign depends
+        # on firmware), frequency, temperature and phase values
+        self._apply_fields(power, data, self._POWER_FIELDS)
+    
+    def _update_battery_data(self, data: Dict[str, Any]):
+        """Update battery measurements."""
+        battery = self.battery_data
+        self._apply_fields(battery, data, self._BATTERY_FIELDS)
         
         # Determine charging/discharging state from running_state
-        running_state = self.client.read_register('running_state')
+        # (read in the same pass as the system info)
+        running_state = data.get('running_state')
         if running_state is not None:
-            # Bit 1: Charging, Bit 2: Discharging
-            self.battery_data.is_charging = bool(running_state & 0x2)
-            self.battery_data.is_discharging = bool(running_state & 0x4)
+            battery.is_charging, battery.is_discharging = self._CHARGE_FLAGS[(running_state >> 1) & 0x3]
         else:
-            # Fallback: determine from current
-            if self.battery_data.current > 0.1:
-                self.battery_data.is_charging = True
-                self.battery_data.is_discharging = False
-            elif self.battery_data.current < -0.1:
-                self.battery_data.is_charging = False
-                self.battery_data.is_discharging = True
-            else:
-                self.battery_data.is_charging = False
-                self.battery_data.is_discharging = False
+            # Fallback: determine from current (0.1 A deadband)
+            battery.is_charging = battery.current > 0.1
+            battery.is_discharging = battery.current < -0.1
     
-    def _update_energy_data(self):
+    def _update_energy_data(self, data: Dict[str, Any]):
         """Update energy counters."""
-        data = self.client.get_energy_data()
-        
-        # Daily counters
-        self.energy_data.daily_pv_generation = data.get('daily_pv_generation', 0.0) or 0.0
-        self.energy_data.daily_imported_energy = data.get('daily_imported_energy', 0.0) or 0.0
-        self.energy_data.daily_exported_energy = data.get('daily_exported_energy', 0.0) or 0.0
-        self.energy_data.daily_battery_charge = data.get('daily_battery_charge', 0.0) or 0.0
-        self.energy_data.daily_battery_discharge = data.get('daily_battery_discharge', 0.0) or 0.0
-        
-        # Total counters
-        self.energy_data.total_pv_generation = data.get('total_pv_generation', 0.0) or 0.0
-        self.energy_data.total_imported_energy = data.get('total_imported_energy', 0.0) or 0.0
-        self.energy_data.total_exported_energy = data.get('total_exported_energy', 0.0) or 0.0
-        self.energy_data.total_battery_charge = data.get('total_battery_charge', 0.0) or 0.0
-        self.energy_data.total_battery_discharge = data.get('total_battery_discharge', 0.0) or 0.0
-    
-    def _update_system_info(self):
+        self._apply_fields(self.energy_data, data, self._ENERGY_FIELDS)
+    
+    def _update_system_info(self, data: Dict[str, Any]):
         """Update system information."""
-        data = self.client.get_system_info()
-        
-        self.system_info.inverter_serial = data.get('inverter_serial', '') or ''
-        self.system_info.device_type_code = data.get('device_type_code', 0) or 0
-        self.system_info.system_state = data.get('system_state', 0) or 0
-        self.system_info.running_state = data.get('running_state', 0) or 0
+        if 'inverter_serial' in data:
+            self._apply_fields(self.system_info, data, self._STATIC_FIELDS)
+            self._static_info_loaded = data['inverter_serial'] is not None
+        self._apply_fields(self.system_info, data, self._SYSTEM_FIELDS)
         
         # Convert system state to text
         self.system_info.system_state_text = self._get_system_state_text(self.system_info.system_state)
         
-        # Read control settings
-        control_data = self.client.read_multiple_registers([
-            'ems_mode_selection', 'min_soc', 'max_soc', 
-            'export_power_limit', 'export_power_limit_mode'
-        ])
-        
-        self.system_info.ems_mode = control_data.get('ems_mode_selection', 0) or 0
-        self.system_info.min_soc = control_data.get('min_soc', 0.0) or 0.0
-        self.system_info.max_soc = control_data.get('max_soc', 0.0) or 0.0
-        self.system_info.export_power_limit = control_data.get('export_power_limit', 0) or 0
-        
-        limit_mode = control_data.get('export_power_limit_mode', 0) or 0
-        self.system_info.export_power_limit_enabled = (limit_mode == 0xAA)
+        self.system_info.export_power_limit_enabled = (data.get('export_power_limit_mode') == 0xAA)
     
     def _get_system_state_text(self, state_code: int) -> str:
         """Convert system state code to readable text."""
-        try:
-            state = SystemState(state_code)
-            return state.name.replace('_', ' ').title()
-        except ValueError:
+        text = _SYSTEM_STATE_TEXT.get(state_code)
+        if text is None:
             return f"Unknown State (0x{state_code:04X})"
+        return text
+    
+    def get_state_array(self) -> array:
+        """
+        Get the numeric state as a flat array('d') in STATE_FIELD_NAMES order.
+        
+        For consumers that want plain numbers (control loops, exporters) rather
+        than the nested get_current_state() dict; the array supports the buffer
+        protocol, so e.g. numpy.frombuffer() wraps it without copying. Like
+        get_current_state() it is rebuilt once per successful update() and shared.
+        """
+        if self._state_array_stamp != self._update_generation:
+            self._state_array = array('d', _STATE_VALUES(self))
+            self._state_array_stamp = self._update_generation
+        return self._state_array
     
     def get_current_state(self) -> Dict[str, Any]:
-        """Get current system state as a dictionary."""
-        return {
+        """
+        Get current system state as a dictionary.
+        
+        The dict is built once per successful update() and shared between callers
+        until the next one, so treat it as read-only.
+        """
+        if self._state_cache_stamp == self._update_generation:
+            return self._state_cache
+        
+        power = self.power_data
+        battery = self.battery_data
+        energy = self.energy_data
+        system = self.system_info
+        self._state_cache = {
             'power': {
-                'solar_power': self.power_data.solar_power,
-                'grid_power': self.power_data.grid_power,
-                'load_power': self.power_data.load_power,
-                'battery_power': self.power_data.battery_power,
-                'total_power': self.power_data.total_power,
-                'grid_frequency': self.power_data.grid_frequency,
-                'inverter_temperature': self.power_data.inverter_temperature,
+                'solar_power': power.solar_power,
+                'grid_power': power.grid_power,
+                'load_power': power.load_power,
+                'battery_power': power.battery_power,
+                'total_power': power.total_power,
+                'grid_frequency': power.grid_frequency,
+                'inverter_temperature': power.inverter_temperature,
             },
             'battery': {
-                'level': self.battery_data.level,
-                'voltage': self.battery_data.voltage,
-                'current': self.battery_data.current,
-                'power': self.battery_data.power,
-                'temperature': self.battery_data.temperature,
-                'state_of_health': self.battery_data.state_of_health,
-                'capacity': self.battery_data.capacity,
-                'is_charging': self.battery_data.is_charging,
-                'is_discharging': self.battery_data.is_discharging,
+                'level': battery.level,
+                'voltage': battery.voltage,
+                'current': battery.current,
+                'power': battery.power,
+                'temperature': battery.temperature,
+                'state_of_health': battery.state_of_health,
+                'capacity': battery.capacity,
+                'is_charging': battery.is_charging,
+                'is_discharging': battery.is_discharging,
             },
             'energy': {
-                'daily_pv_generation': self.energy_data.daily_pv_generation,
-                'daily_imported_energy': self.energy_data.daily_imported_energy,
-                'daily_exported_energy': self.energy_data.daily_exported_energy,
-                'daily_battery_charge': self.energy_data.daily_battery_charge,
-                'daily_battery_discharge': self.energy_data.daily_battery_discharge,
+                'daily_pv_generation': energy.daily_pv_generation,
+                'daily_imported_energy': energy.daily_imported_energy,
+                'daily_exported_energy': energy.daily_exported_energy,
+                'daily_battery_charge': energy.daily_battery_charge,
+                'daily_battery_discharge': energy.daily_battery_discharge,
             },
             'system': {
-                'inverter_serial': self.system_info.inverter_serial,
-                'system_state': self.system_info.system_state_text,
-                'running_state': self.system_info.running_state,
-                'ems_mode': self.system_info.ems_mode,
-                'min_soc': self.system_info.min_soc,
-                'max_soc': self.system_info.max_soc,
-                'export_power_limit': self.system_info.export_power_limit,
-                'export_power_limit_enabled': self.system_info.export_power_limit_enabled,
+                'inverter_serial': system.inverter_serial,
+                'system_state': system.system_state_text,
+                'running_state': system.running_state,
+                'ems_mode': system.ems_mode,
+                'min_soc': system.min_soc,
+                'max_soc': system.max_soc,
+                'export_power_limit': system.export_power_limit,
+                'export_power_limit_enabled': system.export_power_limit_enabled,
             }
         }
+        self._state_cache_stamp = self._update_generation
+        return self._state_cache
     
     # Control Methods
     def set_ems_mode(self, mode: EMSMode) -> bool:
@@ -427,7 +620,7 @@ class SungrowController:
         """
         Force battery charging from grid (useful during cheap energy periods).
         """
-        logger.info(f"🔌 Forcing battery charge from grid at {power}W")
+        logger.info("🔌 Forcing battery charge from grid at %sW", power)
         
         success = self.client.set_battery_forced_mode('charge', power)
         
@@ -479,10 +672,8 @@ class SungrowController:
         
         # Calculate house consumption
         # Energy balance: Solar = Load + Battery_charge + Grid_export
-        if grid >= 0:  # Exporting
-            house_consumption = solar - abs(battery) - grid
-        else:  # Importing
-            house_consumption = solar + abs(grid) - abs(battery)
+        # (importing is a negative export, so one expression covers both directions)
+        house_consumption = solar - abs(battery) - grid
         
         return {
             'solar_generation': solar,
@@ -5,25 +5,56 @@ Provides clean separation between data acquisition and processing.
 """
 
 import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 import time
 import logging
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, AsyncGenerator, Deque
 from datetime import datetime
-from collections import deque, defaultdict
+from collections import deque
+from operator import attrgetter
 from sungrow_controller import SungrowController
 
 logger = logging.getLogger(__name__)
 
+# Numeric sample fields kept in the collector's ring buffers
+BUFFER_KEYS = (
+    'solar_power', 'battery_power', 'grid_power', 'load_power',
+    'battery_soc', 'battery_voltage', 'battery_current', 'battery_temperature',
+    'grid_frequency', 'inverter_temperature',
+)
 
-@dataclass
+# Reads all buffered fields of a sample in one call, in BUFFER_KEYS order
+_BUFFER_VALUES = attrgetter(*BUFFER_KEYS)
+
+# Compact separators; one shared instance keeps json's C encoder set up
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# With a failure counter, a repeating validation failure is logged on its first
+# and then every Nth occurrence
+_VALIDATION_LOG_EVERY = 100
+
+
+def _log_validation_failure(failures: Optional[Dict[str, int]], check: str, message: str, value):
+    """Log a failed validation check, rate-limited per check when counting failures."""
+    if failures is None:
+        logger.warning(message, value)
+        return
+    count = failures[check] = failures.get(check, 0) + 1
+    if count == 1 or count % _VALIDATION_LOG_EVERY == 0:
+        logger.warning(message + " (failure #%d)", value, count)
+
+
+@dataclass(slots=True)
 class TelemetrySample:
     """
     Validated telemetry sample with timestamp and all system data.
     This is the single data structure passed through the async queue.
     """
     timestamp: float = field(default_factory=time.time)
-    datetime: datetime = field(default_factory=datetime.now)
     
     # Power data (W)
     solar_power: float = 0.0
@@ -69,36 +100,42 @@ class TelemetrySample:
     connection_status: str = "connected"
     read_errors: int = 0
     
-    def validate(self) -> bool:
-        """Validate the telemetry sample for basic sanity checks."""
-        try:
-            # Basic range checks
-            if not (0 <= self.battery_soc <= 100):
-                logger.warning(f"Invalid battery SOC: {self.battery_soc}%")
-                return False
-                
-            if not (45 <= self.grid_frequency <= 55):
-                logger.warning(f"Invalid grid frequency: {self.grid_frequency} Hz")
-                return False
-                
-            # Solar power should be negative (generation), only warn if extremely negative
-            if self.solar_power < -50000:  # > 50kW seems unrealistic for most systems
-                logger.warning(f"Extremely negative solar power: {self.solar_power} W")
-                return False
-                
-            # Energy balance check using correct equation: P_load = P_grid - P_battery - P_solar
-            calculated_load = self.grid_power - self.battery_power - self.solar_power
-            if abs(calculated_load - self.load_power) > 100:  # 100W tolerance
-                logger.debug(f"Energy balance deviation: calculated={calculated_load:.0f}W, "
-                           f"stored={self.load_power:.0f}W")
-                # Update with calculated value
-                self.load_power = calculated_load
-                
-            return True
+    @property
+    def datetime(self) -> datetime:
+        """Local time of the sample, derived from timestamp when needed."""
+        return datetime.fromtimestamp(self.timestamp)
+    
+    def validate(self, failures: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Validate the telemetry sample for basic sanity checks.
+        
+        If a `failures` dict is given, each failed check is counted in it by name
+        and its warning is rate-limited, so a stuck sensor does not flood the log.
+        Errors are not caught here; collect_sample() handles them.
+        """
+        # Basic range checks
+        if not (0 <= self.battery_soc <= 100):
+            _log_validation_failure(failures, 'battery_soc', "Invalid battery SOC: %s%%", self.battery_soc)
+            return False
             
-        except Exception as e:
-            logger.error(f"Validation error: {e}")
+        if not (45 <= self.grid_frequency <= 55):
+            _log_validation_failure(failures, 'grid_frequency', "Invalid grid frequency: %s Hz", self.grid_frequency)
             return False
+            
+        # Solar power should be negative (generation), only warn if extremely negative
+        if self.solar_power < -50000:  # > 50kW seems unrealistic for most systems
+            _log_validation_failure(failures, 'solar_power', "Extremely negative solar power: %s W", self.solar_power)
+            return False
+            
+        # Energy balance check using correct equation: P_load = P_grid - P_battery - P_solar
+        calculated_load = self.grid_power - self.battery_power - self.solar_power
+        if abs(calculated_load - self.load_power) > 100:  # 100W tolerance
+            logger.debug("Energy balance deviation: calculated=%.0fW, stored=%.0fW",
+                         calculated_load, self.load_power)
+            # Update with calculated value
+            self.load_power = calculated_load
+            
+        return True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization/logging."""
@@ -116,6 +153,75 @@ class TelemetrySample:
             'data_valid': self.data_valid,
             'connection_status': self.connection_status
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the to_dict() fields as compact UTF-8 JSON, e.g. for a socket sink."""
+        return _JSON_ENCODER.encode(self.to_dict()).encode()
+
+
+class SampleRing:
+    """
+    Bounded single-producer sample queue that drops the oldest entry when full.
+    
+    Covers the part of the asyncio.Queue API the collector uses, on a fixed
+    power-of-two slot list with free-running head/tail counters and a single
+    Event for waking consumers, so a put or get allocates nothing.
+    
+    Waiting consumers are woken once `notify_every` items are pending (or on
+    flush()), so fast producers wake them per batch rather than per item.
+    """
+    
+    def __init__(self, maxsize: int = 100, notify_every: int = 1):
+        self.maxsize = max(1, maxsize)
+        self.notify_every = max(1, min(notify_every, self.maxsize))
+        capacity = 1 << (self.maxsize - 1).bit_length()
+        self._buf: list = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._not_empty = asyncio.Event()
+    
+    def qsize(self) -> int:
+        return self._tail - self._head
+    
+    def empty(self) -> bool:
+        return self._tail == self._head
+    
+    def full(self) -> bool:
+        return self._tail - self._head >= self.maxsize
+    
+    def put_nowait(self, item):
+        """Add an item, discarding the oldest one if the queue is full."""
+        if self._tail - self._head >= self.maxsize:
+            self._buf[self._head & self._mask] = None
+            self._head += 1
+        self._buf[self._tail & self._mask] = item
+        self._tail += 1
+        if self._tail - self._head >= self.notify_every:
+            self._not_empty.set()
+    
+    def flush(self):
+        """Wake waiting consumers for any pending items, even a partial batch."""
+        if self._tail != self._head:
+            self._not_empty.set()
+    
+    def get_nowait(self):
+        """Remove and return the oldest item; raises asyncio.QueueEmpty if there is none."""
+        if self._tail == self._head:
+            raise asyncio.QueueEmpty
+        slot = self._head & self._mask
+        item = self._buf[slot]
+        self._buf[slot] = None
+        self._head += 1
+        if self._tail == self._head:
+            self._not_empty.clear()
+        return item
+    
+    async def get(self):
+        """Remove and return the oldest item, waiting until one is available."""
+        while self._tail == self._head:
+            await self._not_empty.wait()
+        return self.get_nowait()
 
 
 class TelemetryCollector:
@@ -134,10 +240,12 @@ class TelemetryCollector:
         self.controller = controller
         self.sample_rate = sample_rate
         self.sample_interval = 1.0 / sample_rate
-        self.queue = asyncio.Queue(maxsize=queue_maxsize)
+        # At higher sample rates, wake consumers about 4 times a second instead of per sample
+        self.queue = SampleRing(queue_maxsize, notify_every=int(sample_rate / 4))
         self.running = False
         self.sample_count = 0
         self.error_count = 0
+        self.validation_failures: Dict[str, int] = {}  # failed samples per validation check
         
         # Ring buffer parameters
         self.short_window_seconds = short_window_seconds
@@ -145,31 +253,52 @@ class TelemetryCollector:
         self.short_buffer_size = int(short_window_seconds * sample_rate)
         self.long_buffer_size = int(long_window_seconds * sample_rate)
         
-        # Ring buffers for time-series data (bounded memory)
-        # These store raw numeric values for O(1) statistical operations
-        self.short_buffers: Dict[str, Deque[float]] = defaultdict(
-            lambda: deque(maxlen=self.short_buffer_size)
-        )
-        self.long_buffers: Dict[str, Deque[float]] = defaultdict(
-            lambda: deque(maxlen=self.long_buffer_size)
-        )
+        # One worker thread for all blocking Modbus calls: the inverter serves one
+        # request at a time, so a wider pool only adds contention (created in start())
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        
+        self._init_ring_buffers()
+        
+    def _init_ring_buffers(self):
+        """
+        Allocate the ring buffers for the configured window sizes.
+        
+        All metrics share one write index; each metric is a preallocated float32
+        column sized for the long window, and the short window is read from its
+        newest entries, so a sample is stored with one write per metric. The
+        columns are rounded up to a power of two so slots are found with a bit
+        mask; the windows themselves keep their configured sizes.
+        """
+        self.buffer_keys = list(BUFFER_KEYS)
+        self._key_index = {key: i for i, key in enumerate(BUFFER_KEYS)}
+        window = max(self.short_buffer_size, self.long_buffer_size, 1)
+        self._ring_size = 1 << (window - 1).bit_length()
+        self._ring_mask = self._ring_size - 1
+        # float32 columns, as in monitor.RollingStats: half the size of float64 and
+        # still far finer than the 0.1 W / 0.01 Hz resolution of the inverter registers
+        self._ring = [array('f', [0.0]) * self._ring_size for _ in BUFFER_KEYS]
+        self._write_index = 0  # total samples written; slot is write_index & ring mask
+        
+        # Running Σx and Σx² per metric for each window, so mean/std need no pass
+        # over the history: window -> (size, sums, sums of squares)
+        k = len(BUFFER_KEYS)
+        self._window_sums = {
+            'short': (self.short_buffer_size, [0.0] * k, [0.0] * k),
+            'long': (self.long_buffer_size, [0.0] * k, [0.0] * k),
+        }
         
         # Ring buffer for complete samples (for replay/debugging)
         self.sample_buffer: Deque[TelemetrySample] = deque(maxlen=self.short_buffer_size)
         
-        # Buffer metadata
-        self.buffer_keys = [
-            'solar_power', 'battery_power', 'grid_power', 'load_power',
-            'battery_soc', 'battery_voltage', 'battery_current', 'battery_temperature',
-            'grid_frequency', 'inverter_temperature'
-        ]
-        
     async def start(self) -> bool:
         """Start the collector (connect to hardware)."""
-        loop = asyncio.get_event_loop()
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sungrow-io')
         
-        # Run blocking connection call in thread pool
-        connected = await loop.run_in_executor(None, self.controller.connect)
+        # Run blocking connection call on the I/O thread
+        connected = await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, self.controller.connect
+        )
         
         if connected:
             self.running = True
@@ -182,8 +311,10 @@ class TelemetryCollector:
     async def stop(self):
         """Stop the collector."""
         self.running = False
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.controller.disconnect)
+        await asyncio.get_running_loop().run_in_executor(self._io_executor, self.controller.disconnect)
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=False)
+            self._io_executor = None
         logger.info("🔌 Telemetry collector stopped")
     
     def _append_to_ring_buffers(self, sample: TelemetrySample):
@@ -197,38 +328,59 @@ class TelemetryCollector:
         # Store complete sample
         self.sample_buffer.append(sample)
         
-        # Extract and store numeric values in ring buffers
-        sample_data = {
-            'solar_power': sample.solar_power,
-            'battery_power': sample.battery_power,
-            'grid_power': sample.grid_power,
-            'load_power': sample.load_power,
-            'battery_soc': sample.battery_soc,
-            'battery_voltage': sample.battery_voltage,
-            'battery_current': sample.battery_current,
-            'battery_temperature': sample.battery_temperature,
-            'grid_frequency': sample.grid_frequency,
-            'inverter_temperature': sample.inverter_temperature,
-        }
+        index = self._write_index
+        mask = self._ring_mask
+        slot = index & mask
+        ring = self._ring
+        # Rounded to float32 up front so the sums see exactly what the columns
+        # store (and later evict)
+        values = array('f', _BUFFER_VALUES(sample))
         
-        # Append to both short and long ring buffers (O(1) operation)
-        for key in self.buffer_keys:
-            if key in sample_data:
-                value = sample_data[key]
-                if isinstance(value, (int, float)):
-                    self.short_buffers[key].append(value)
-                    self.long_buffers[key].append(value)
+        # Move each window's running sums forward: add the new value and drop the
+        # one leaving the window, read before the slot is overwritten (the long
+        # window's oldest value lives there)
+        for size, sums, sums_sq in self._window_sums.values():
+            if size and index >= size:
+                evicted = (index - size) & mask
+                for i, value in enumerate(values):
+                    old = ring[i][evicted]
+                    sums[i] += value - old
+                    sums_sq[i] += value * value - old * old
+            else:
+                for i, value in enumerate(values):
+                    sums[i] += value
+                    sums_sq[i] += value * value
+        
+        # Store numeric values in the shared slot of every column (O(1) operation)
+        for column, value in zip(ring, values):
+            column[slot] = value
+        self._write_index = index + 1
+        
+        if self._write_index & mask == 0:
+            self._resync_window_sums()
+    
+    def _resync_window_sums(self):
+        """Recompute the running sums exactly once per ring wrap to stop float drift."""
+        for size, sums, sums_sq in self._window_sums.values():
+            for i, key in enumerate(BUFFER_KEYS):
+                values = self._window(key, size)
+                sums[i] = math.fsum(values)
+                sums_sq[i] = math.fsum(v * v for v in values)
     
     def _create_sample_from_controller_data(self) -> TelemetrySample:
         """Create a telemetry sample from current controller data."""
         try:
             # Get current state from controller
             state = self.controller.get_current_state()
+            power = state['power'].get
+            battery = state['battery'].get
+            system = state['system'].get
+            energy = state['energy'].get
             
             # Get power values for energy balance calculation
-            solar_power = state['power'].get('solar_power', 0)
-            battery_power = state['power'].get('battery_power', 0)
-            grid_power = state['power'].get('grid_power', 0)
+            solar_power = power('solar_power', 0)
+            battery_power = power('battery_power', 0)
+            grid_power = power('grid_power', 0)
             
             # Calculate load power from energy balance: P_load = P_grid - P_battery - P_solar
             # This is more accurate than the load_power register
@@ -240,38 +392,38 @@ class TelemetryCollector:
                 solar_power=solar_power,
                 battery_power=battery_power,
                 grid_power=grid_power,
-                total_power=state['power'].get('total_power', 0),
+                total_power=power('total_power', 0),
                 
                 # Battery data  
-                battery_soc=state['battery'].get('level', 0),
-                battery_voltage=state['battery'].get('voltage', 0),
-                battery_current=state['battery'].get('current', 0),
-                battery_temperature=state['battery'].get('temperature', 0),
-                battery_soh=state['battery'].get('state_of_health', 0),
-                battery_capacity=state['battery'].get('capacity', 0),
+                battery_soc=battery('level', 0),
+                battery_voltage=battery('voltage', 0),
+                battery_current=battery('current', 0),
+                battery_temperature=battery('temperature', 0),
+                battery_soh=battery('state_of_health', 0),
+                battery_capacity=battery('capacity', 0),
                 
                 # System data
-                grid_frequency=state['power'].get('grid_frequency', 0),
-                inverter_temperature=state['power'].get('inverter_temperature', 0),
-                system_state=state['system'].get('system_state', 'Unknown'),
-                running_state=state['system'].get('running_state', 0),
-                ems_mode=state['system'].get('ems_mode', 0),
+                grid_frequency=power('grid_frequency', 0),
+                inverter_temperature=power('inverter_temperature', 0),
+                system_state=system('system_state', 'Unknown'),
+                running_state=system('running_state', 0),
+                ems_mode=system('ems_mode', 0),
                 
                 # Control settings
-                min_soc=state['system'].get('min_soc', 0),
-                max_soc=state['system'].get('max_soc', 0),
-                export_power_limit=state['system'].get('export_power_limit', 0),
-                export_power_limit_enabled=state['system'].get('export_power_limit_enabled', False),
+                min_soc=system('min_soc', 0),
+                max_soc=system('max_soc', 0),
+                export_power_limit=system('export_power_limit', 0),
+                export_power_limit_enabled=system('export_power_limit_enabled', False),
                 
                 # Energy counters
-                daily_pv_generation=state['energy'].get('daily_pv_generation', 0),
-                daily_imported_energy=state['energy'].get('daily_imported_energy', 0),
-                daily_exported_energy=state['energy'].get('daily_exported_energy', 0),
-                daily_battery_charge=state['energy'].get('daily_battery_charge', 0),
-                daily_battery_discharge=state['energy'].get('daily_battery_discharge', 0),
+                daily_pv_generation=energy('daily_pv_generation', 0),
+                daily_imported_energy=energy('daily_imported_energy', 0),
+                daily_exported_energy=energy('daily_exported_energy', 0),
+                daily_battery_charge=energy('daily_battery_charge', 0),
+                daily_battery_discharge=energy('daily_battery_discharge', 0),
                 
                 # System identification
-                inverter_serial=state['system'].get('inverter_serial', ''),
+                inverter_serial=system('inverter_serial', ''),
                 device_type_code=0,  # Not currently in state dict
                 
                 # Use calculated load power from energy balance
@@ -297,11 +449,10 @@ class TelemetryCollector:
     async def collect_sample(self) -> Optional[TelemetrySample]:
         """Collect a single telemetry sample."""
         try:
-            # Run blocking I/O in thread pool
-            loop = asyncio.get_event_loop()
-            
-            # Update controller data
-            update_success = await loop.run_in_executor(None, self.controller.update)
+            # Update controller data (blocking I/O on the collector's I/O thread)
+            update_success = await asyncio.get_running_loop().run_in_executor(
+                self._io_executor, self.controller.update
+            )
             
             if not update_success:
                 self.error_count += 1
@@ -316,7 +467,7 @@ class TelemetryCollector:
             sample = self._create_sample_from_controller_data()
             
             # Validate sample
-            if sample.validate():
+            if sample.validate(self.validation_failures):
                 self.sample_count += 1
                 return sample
             else:
@@ -337,9 +488,11 @@ class TelemetryCollector:
         """Main collector loop - runs as background task."""
         logger.info("🚀 Starting telemetry collection loop")
         
+        # Cycle N is due at start + N * sample_interval on the monotonic clock,
+        # so per-cycle jitter does not accumulate into drift
+        next_deadline = time.monotonic()
+        
         while self.running:
-            start_time = time.time()
-            
             try:
                 # Collect sample
                 sample = await self.collect_sample()
@@ -348,25 +501,21 @@ class TelemetryCollector:
                     # Append to ring buffers (O(1) operation, bounded memory)
                     self._append_to_ring_buffers(sample)
                     
-                    # Try to put sample in queue (non-blocking)
-                    try:
-                        self.queue.put_nowait(sample)
-                    except asyncio.QueueFull:
+                    # Put sample in queue (non-blocking, replaces the oldest when full)
+                    if self.queue.full():
                         logger.warning("Telemetry queue full, dropping oldest sample")
-                        try:
-                            self.queue.get_nowait()  # Remove oldest
-                            self.queue.put_nowait(sample)  # Add new
-                        except asyncio.QueueEmpty:
-                            pass
+                    self.queue.put_nowait(sample)
                 
                 # Maintain sample rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0, self.sample_interval - elapsed)
+                next_deadline += self.sample_interval
+                sleep_time = next_deadline - time.monotonic()
                 
                 if sleep_time > 0:
                     await asyncio.sleep(sleep_time)
                 else:
                     logger.debug(f"Collection cycle overrun by {-sleep_time:.3f}s")
+                    # Start a fresh schedule rather than bursting to catch up
+                    next_deadline = time.monotonic()
                     
             except asyncio.CancelledError:
                 logger.info("Telemetry collector cancelled")
@@ -375,6 +524,7 @@ class TelemetryCollector:
                 logger.error(f"Unexpected error in collector loop: {e}")
                 await asyncio.sleep(1.0)  # Brief pause before retry
         
+        self.queue.flush()
         logger.info("🛑 Telemetry collection loop stopped")
     
     async def get_sample(self) -> TelemetrySample:
@@ -408,20 +558,69 @@ class TelemetryCollector:
         
         return samples
     
+    def _window(self, key: str, size: int) -> array:
+        """Return the newest `size` values of a metric, oldest first."""
+        index = self._key_index.get(key)
+        if index is None:
+            return array('f')
+        column = self._ring[index]
+        count = min(self._write_index, size, self._ring_size)
+        end = self._write_index & self._ring_mask
+        start = end - count
+        if start >= 0:
+            return column[start:end]
+        return column[start:] + column[:end]
+    
     # Read-only access to ring buffers for downstream consumers
-    def get_short_buffer(self, key: str) -> Deque[float]:
+    def get_short_buffer(self, key: str) -> array:
         """
-        Get read-only reference to short-term ring buffer.
-        Consumers MUST treat this as read-only - do not modify!
+        Get a snapshot of the short-term ring buffer, oldest value first.
+        Unknown keys return an empty buffer.
         """
-        return self.short_buffers[key]
+        return self._window(key, self.short_buffer_size)
     
-    def get_long_buffer(self, key: str) -> Deque[float]:
+    def get_long_buffer(self, key: str) -> array:
         """
-        Get read-only reference to long-term ring buffer.
-        Consumers MUST treat this as read-only - do not modify!
+        Get a snapshot of the long-term ring buffer, oldest value first.
+        Unknown keys return an empty buffer.
         """
-        return self.long_buffers[key]
+        return self._window(key, self.long_buffer_size)
+    
+    def get_mean(self, key: str, window: str = 'short') -> float:
+        """Mean of a metric over the 'short' or 'long' window in O(1); 0.0 while empty."""
+        size, sums, _ = self._window_sums[window]
+        index = self._key_index.get(key)
+        count = min(self._write_index, size)
+        if index is None or count == 0:
+            return 0.0
+        return sums[index] / count
+    
+    def get_std(self, key: str, window: str = 'short') -> float:
+        """Sample standard deviation of a metric over the 'short' or 'long' window in O(1)."""
+        size, sums, sums_sq = self._window_sums[window]
+        index = self._key_index.get(key)
+        count = min(self._write_index, size)
+        if index is None or count < 2:
+            return 0.0
+        mean = sums[index] / count
+        variance = (sums_sq[index] - count * mean * mean) / (count - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+    
+    def get_stats_window(self, key: str, window: str = 'short') -> Dict[str, float]:
+        """
+        Get mean, min, max and standard deviation of a metric over the 'short' or
+        'long' window. Mean and std come from the running sums; min and max are
+        one C-level pass over the contiguous column snapshot.
+        """
+        values = self._window(key, self._window_sums[window][0])
+        if not values:
+            return {'mean': 0.0, 'min': 0.0, 'max': 0.0, 'std': 0.0}
+        return {
+            'mean': self.get_mean(key, window),
+            'min': min(values),
+            'max': max(values),
+            'std': self.get_std(key, window),
+        }
     
     def get_sample_buffer(self) -> Deque[TelemetrySample]:
         """
@@ -430,19 +629,27 @@ class TelemetryCollector:
         """
         return self.sample_buffer
     
-    def get_buffer_info(self) -> Dict[str, Any]:
-        """Get ring buffer metadata and statistics."""
-        return {
+    def get_buffer_info(self, include_stats: bool = False) -> Dict[str, Any]:
+        """
+        Get ring buffer metadata and statistics.
+        
+        With include_stats, also returns get_stats_window() over the long window
+        for every buffered metric under 'long_window_stats'.
+        """
+        info = {
             'short_window_seconds': self.short_window_seconds,
             'long_window_seconds': self.long_window_seconds,
             'short_buffer_size': self.short_buffer_size,
             'long_buffer_size': self.long_buffer_size,
             'sample_rate': self.sample_rate,
             'buffer_keys': self.buffer_keys,
-            'short_buffer_lengths': {key: len(buf) for key, buf in self.short_buffers.items()},
-            'long_buffer_lengths': {key: len(buf) for key, buf in self.long_buffers.items()},
+            'short_buffer_lengths': dict.fromkeys(self.buffer_keys, min(self._write_index, self.short_buffer_size)),
+            'long_buffer_lengths': dict.fromkeys(self.buffer_keys, min(self._write_index, self.long_buffer_size)),
             'sample_buffer_length': len(self.sample_buffer)
         }
+        if include_stats:
+            info['long_window_stats'] = {key: self.get_stats_window(key, 'long') for key in self.buffer_keys}
+        return info
     
     def get_stats(self) -> Dict[str, Any]:
         """Get collector statistics."""
@@ -453,7 +660,8 @@ class TelemetryCollector:
             'error_rate': self.error_count / max(1, self.sample_count),
             'queue_size': self.queue.qsize(),
             'queue_maxsize': self.queue.maxsize,
-            'sample_rate_hz': 1.0 / self.sample_interval
+            'sample_rate_hz': 1.0 / self.sample_interval,
+            'validation_failures': dict(self.validation_failures)
         }
 
 
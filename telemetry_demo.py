@@ -9,13 +9,35 @@ import json
 import time
 import math
 import logging
-from typing import List, Dict, Any
+import re
+from dataclasses import fields
+from operator import attrgetter
+from collections import deque
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
-from telemetry import TelemetrySample, TelemetryCollector
+from telemetry import TelemetrySample, TelemetryCollector, SampleRing
 from sungrow_controller import SungrowController
 
 logger = logging.getLogger(__name__)
 
+_JSON_ENCODER = json.JSONEncoder()
+_JSON_DECODER = json.JSONDecoder()
+
+# TelemetrySample.to_dict() fields kept per logged sample; 'datetime' is derived
+# from the timestamp when the log is written
+_LOG_FIELDS = (
+    'timestamp', 'solar_power', 'battery_power', 'grid_power', 'load_power',
+    'battery_soc', 'grid_frequency', 'inverter_temperature', 'system_state',
+    'data_valid', 'connection_status',
+)
+_LOG_VALUES = attrgetter(*_LOG_FIELDS)
+
+# Whitespace and commas between the elements of a JSON array
+_ARRAY_SEPARATORS = re.compile(r'[\s,]*')
+
+# Every TelemetrySample field after the leading timestamp, in constructor order
+_REPLAY_VALUES = attrgetter(*(f.name for f in fields(TelemetrySample)[1:]))
+
 
 class MockTelemetryCollector(TelemetryCollector):
     """
@@ -23,38 +45,34 @@ class MockTelemetryCollector(TelemetryCollector):
     Shows how the abstraction enables stubbing.
     """
     
-    def __init__(self, sample_data: List[Dict[str, Any]], sample_rate: float = 2.0):
+    def __init__(self, sample_data: Iterable[Dict[str, Any]], sample_rate: float = 2.0):
         # Don't call super().__init__ to avoid creating real controller
-        self.sample_data = sample_data
         self.sample_rate = sample_rate
         self.sample_interval = 1.0 / sample_rate
-        self.queue = asyncio.Queue(maxsize=100)
+        self.queue = SampleRing(100)
         self.running = False
         self.sample_count = 0
         self.error_count = 0
         self.current_index = 0
         
+        # Logged samples parsed once into positional field values; 'datetime' in
+        # logged samples is derived from the timestamp, not a field
+        self._replay_rows = [
+            _REPLAY_VALUES(TelemetrySample(**{k: v for k, v in sample_dict.items() if k != 'datetime'}))
+            for sample_dict in sample_data
+        ]
+        
         # Initialize ring buffers (same as real collector)
-        from collections import deque, defaultdict
         self.short_window_seconds = 30
         self.long_window_seconds = 300
         self.short_buffer_size = int(self.short_window_seconds * sample_rate)
         self.long_buffer_size = int(self.long_window_seconds * sample_rate)
-        
-        self.short_buffers = defaultdict(lambda: deque(maxlen=self.short_buffer_size))
-        self.long_buffers = defaultdict(lambda: deque(maxlen=self.long_buffer_size))
-        self.sample_buffer = deque(maxlen=self.short_buffer_size)
-        
-        self.buffer_keys = [
-            'solar_power', 'battery_power', 'grid_power', 'load_power',
-            'battery_soc', 'battery_voltage', 'battery_current', 'battery_temperature',
-            'grid_frequency', 'inverter_temperature'
-        ]
+        self._init_ring_buffers()
     
     async def start(self) -> bool:
         """Mock start - always succeeds."""
         self.running = True
-        logger.info(f"🎬 Mock telemetry collector started with {len(self.sample_data)} samples")
+        logger.info(f"🎬 Mock telemetry collector started with {len(self._replay_rows)} samples")
         return True
     
     async def stop(self):
@@ -64,17 +82,15 @@ class MockTelemetryCollector(TelemetryCollector):
     
     async def collect_sample(self) -> TelemetrySample:
         """Collect sample from mock data."""
-        if self.current_index >= len(self.sample_data):
+        if self.current_index >= len(self._replay_rows):
             # Loop back to beginning for continuous replay
             self.current_index = 0
         
-        sample_dict = self.sample_data[self.current_index]
+        row = self._replay_rows[self.current_index]
         self.current_index += 1
         
-        # Create TelemetrySample from dict data
-        sample = TelemetrySample(**sample_dict)
-        sample.timestamp = time.time()
-        sample.datetime = datetime.now()
+        # Fresh sample per call (consumers may modify it), stamped with the current time
+        sample = TelemetrySample(time.time(), *row)
         
         self.sample_count += 1
         return sample
@@ -91,28 +107,26 @@ class StubTelemetryCollector(TelemetryCollector):
         self.scenario = scenario
         self.sample_rate = sample_rate
         self.sample_interval = 1.0 / sample_rate
-        self.queue = asyncio.Queue(maxsize=100)
+        self.queue = SampleRing(100)
         self.running = False
         self.sample_count = 0
         self.error_count = 0
         self.start_time = time.time()
         
+        # Scenario resolved once instead of compared on every sample
+        self._scenario_generator = {
+            "normal": self._normal_scenario,
+            "peak_shaving": self._peak_shaving_scenario,
+            "grid_outage": self._grid_outage_scenario,
+        }.get(scenario, self._default_scenario)
+        self._system_state = f"Running {scenario.title()}"
+        
         # Initialize ring buffers (same as real collector)
-        from collections import deque, defaultdict
         self.short_window_seconds = 30
         self.long_window_seconds = 300
         self.short_buffer_size = int(self.short_window_seconds * sample_rate)
         self.long_buffer_size = int(self.long_window_seconds * sample_rate)
-        
-        self.short_buffers = defaultdict(lambda: deque(maxlen=self.short_buffer_size))
-        self.long_buffers = defaultdict(lambda: deque(maxlen=self.long_buffer_size))
-        self.sample_buffer = deque(maxlen=self.short_buffer_size)
-        
-        self.buffer_keys = [
-            'solar_power', 'battery_power', 'grid_power', 'load_power',
-            'battery_soc', 'battery_voltage', 'battery_current', 'battery_temperature',
-            'grid_frequency', 'inverter_temperature'
-        ]
+        self._init_ring_buffers()
     
     async def start(self) -> bool:
         """Stub start - always succeeds."""
@@ -126,36 +140,41 @@ class StubTelemetryCollector(TelemetryCollector):
         self.running = False
         logger.info("🤖 Stub telemetry collector stopped")
     
+    @staticmethod
+    def _normal_scenario(elapsed_time: float) -> Tuple[float, float, float, float]:
+        """Normal operation with some solar generation."""
+        solar_power = max(0, 4000 + 2000 * (0.5 + 0.4 * math.sin(elapsed_time / 10)))
+        battery_soc = 50 + 30 * math.sin(elapsed_time / 60)
+        battery_power = 1000 * math.sin(elapsed_time / 20)
+        grid_power = solar_power - 1200 - battery_power
+        return solar_power, battery_soc, battery_power, grid_power
+    
+    @staticmethod
+    def _peak_shaving_scenario(elapsed_time: float) -> Tuple[float, float, float, float]:
+        """Peak shaving scenario."""
+        solar_power = 6000 if 10 < elapsed_time % 60 < 50 else 2000
+        battery_soc = max(20, 80 - elapsed_time / 10)  # Discharging
+        battery_power = -2000 if battery_soc > 25 else 0  # Discharge until low
+        grid_power = solar_power - 3000 - battery_power
+        return solar_power, battery_soc, battery_power, grid_power
+    
+    @staticmethod
+    def _grid_outage_scenario(elapsed_time: float) -> Tuple[float, float, float, float]:
+        """Grid outage scenario."""
+        solar_power = 3000
+        battery_soc = max(10, 60 - elapsed_time / 5)  # Rapid discharge
+        battery_power = -2500  # Emergency discharge
+        grid_power = 0  # No grid
+        return solar_power, battery_soc, battery_power, grid_power
+    
+    @staticmethod
+    def _default_scenario(elapsed_time: float) -> Tuple[float, float, float, float]:
+        """Default case: constant values."""
+        return 2000, 50, 0, 500
+    
     def _generate_scenario_data(self, elapsed_time: float) -> Dict[str, Any]:
         """Generate synthetic data based on scenario."""
-        
-        if self.scenario == "normal":
-            # Normal operation with some solar generation
-            solar_power = max(0, 4000 + 2000 * (0.5 + 0.4 * math.sin(elapsed_time / 10)))
-            battery_soc = 50 + 30 * math.sin(elapsed_time / 60)
-            battery_power = 1000 * math.sin(elapsed_time / 20)
-            grid_power = solar_power - 1200 - battery_power
-            
-        elif self.scenario == "peak_shaving":
-            # Peak shaving scenario
-            solar_power = 6000 if 10 < elapsed_time % 60 < 50 else 2000
-            battery_soc = max(20, 80 - elapsed_time / 10)  # Discharging
-            battery_power = -2000 if battery_soc > 25 else 0  # Discharge until low
-            grid_power = solar_power - 3000 - battery_power
-            
-        elif self.scenario == "grid_outage":
-            # Grid outage scenario
-            solar_power = 3000
-            battery_soc = max(10, 60 - elapsed_time / 5)  # Rapid discharge
-            battery_power = -2500  # Emergency discharge
-            grid_power = 0  # No grid
-            
-        else:
-            # Default case
-            solar_power = 2000
-            battery_soc = 50
-            battery_power = 0
-            grid_power = 500
+        solar_power, battery_soc, battery_power, grid_power = self._scenario_generator(elapsed_time)
         
         # Calculate load from energy balance
         load_power = solar_power - battery_power - grid_power
@@ -168,7 +187,7 @@ class StubTelemetryCollector(TelemetryCollector):
             'battery_soc': max(0, min(100, battery_soc)),
             'grid_frequency': 50.0 + 0.1 * math.sin(elapsed_time),
             'inverter_temperature': 45 + 10 * math.sin(elapsed_time / 30),
-            'system_state': f"Running {self.scenario.title()}",
+            'system_state': self._system_state,
             'running_state': 11,
             'ems_mode': 0,
             'data_valid': True,
@@ -177,12 +196,9 @@ class StubTelemetryCollector(TelemetryCollector):
     
     async def collect_sample(self) -> TelemetrySample:
         """Generate synthetic sample."""
-        elapsed_time = time.time() - self.start_time
-        
-        sample_data = self._generate_scenario_data(elapsed_time)
-        sample = TelemetrySample(**sample_data)
-        sample.timestamp = time.time()
-        sample.datetime = datetime.now()
+        now = time.time()
+        sample_data = self._generate_scenario_data(now - self.start_time)
+        sample = TelemetrySample(timestamp=now, **sample_data)
         
         self.sample_count += 1
         return sample
@@ -194,19 +210,45 @@ class TelemetryLogger:
     Demonstrates data persistence capability.
     """
     
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, max_samples: Optional[int] = None):
         self.filename = filename
-        self.samples = []
+        # Logged samples as plain value tuples in _LOG_FIELDS order; with
+        # max_samples only the newest ones are kept
+        self.samples: deque[Tuple] = deque(maxlen=max_samples)
     
     def log_sample(self, sample: TelemetrySample):
         """Log a sample to memory."""
-        self.samples.append(sample.to_dict())
+        self.samples.append(_LOG_VALUES(sample))
     
     def save_to_file(self):
         """Save logged samples to JSON file."""
+        self._write_samples(list(self.samples))
+    
+    async def save_to_file_async(self):
+        """Save logged samples to JSON file without blocking the event loop."""
+        # Snapshot so samples logged during the write are not seen half-way
+        await asyncio.to_thread(self._write_samples, list(self.samples))
+    
+    @staticmethod
+    def _row_to_dict(row: Tuple) -> Dict[str, Any]:
+        """Expand a logged value tuple into the TelemetrySample.to_dict() layout."""
+        timestamp = row[0]
+        record = {'timestamp': timestamp, 'datetime': datetime.fromtimestamp(timestamp).isoformat()}
+        record.update(zip(_LOG_FIELDS[1:], row[1:]))
+        return record
+    
+    def _write_samples(self, samples: List[Tuple]):
+        """
+        Write samples as a JSON array, one sample per line.
+        
+        json only uses its C encoder without indent, so each sample is encoded
+        compactly and the array is assembled and written in one go.
+        """
+        encode = _JSON_ENCODER.encode
+        row_to_dict = self._row_to_dict
         with open(self.filename, 'w') as f:
-            json.dump(self.samples, f, indent=2)
-        logger.info(f"💾 Saved {len(self.samples)} samples to {self.filename}")
+            f.write('[' + ',\n '.join([encode(row_to_dict(row)) for row in samples]) + ']\n')
+        logger.info(f"💾 Saved {len(samples)} samples to {self.filename}")
     
     @classmethod
     def load_from_file(cls, filename: str) -> List[Dict[str, Any]]:
@@ -215,6 +257,42 @@ class TelemetryLogger:
             data = json.load(f)
         logger.info(f"📂 Loaded {len(data)} samples from {filename}")
         return data
+    
+    @classmethod
+    def iter_from_file(cls, filename: str, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Yield logged samples one at a time from a JSON array file.
+        
+        The file is read in chunks and each element decoded as soon as it is
+        complete, so the whole array is never held as text or parsed at once.
+        """
+        skip = _ARRAY_SEPARATORS.match
+        with open(filename, 'r') as f:
+            buf = f.read(chunk_size)
+            idx = skip(buf).end()
+            if not buf.startswith('[', idx):
+                raise ValueError(f"{filename} does not contain a JSON array")
+            idx += 1
+            count = 0
+            
+            while True:
+                idx = skip(buf, idx).end()
+                if buf.startswith(']', idx):
+                    break
+                try:
+                    item, idx = _JSON_DECODER.raw_decode(buf, idx)
+                except json.JSONDecodeError:
+                    # Element cut off at the chunk boundary: keep the tail, read on
+                    more = f.read(chunk_size)
+                    if not more:
+                        raise
+                    buf = buf[idx:] + more
+                    idx = 0
+                    continue
+                count += 1
+                yield item
+        
+        logger.info(f"📂 Loaded {count} samples from {filename}")
 
 
 async def demo_real_system():
@@ -240,8 +318,8 @@ async def demo_real_system():
             print(f"   Sample {i+1}: Solar={sample.solar_power:.0f}W, "
                   f"Battery={sample.battery_soc:.1f}%, Grid={sample.grid_power:.0f}W")
         
-        # Save to file
-        logger_demo.save_to_file()
+        # Save to file (off the event loop)
+        await logger_demo.save_to_file_async()
         
         await collector.stop()
         print("✅ Real system demo complete\n")
@@ -256,28 +334,30 @@ async def demo_replay_system():
     print("=" * 60)
     
     try:
-        # Load logged data
-        sample_data = TelemetryLogger.load_from_file("telemetry_log.json")
+        # Stream logged data straight into the mock's replay table
+        sample_data = TelemetryLogger.iter_from_file("telemetry_log.json")
         
         # Create mock collector for replay
         mock_collector = MockTelemetryCollector(sample_data, sample_rate=10.0)  # Faster replay
         await mock_collector.start()
         
-        # Start collector task
-        collector_task = asyncio.create_task(mock_collector.run_collector())
-        
-        print("📊 Replaying logged samples...")
-        
-        # Get replayed samples
-        for i in range(5):
-            sample = await mock_collector.get_sample()
+        # Collector task runs until stop() ends its loop; the group waits for it
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(mock_collector.run_collector())
             
-            print(f"   Replay {i+1}: Solar={sample.solar_power:.0f}W, "
-                  f"Battery={sample.battery_soc:.1f}%, Status={sample.connection_status}")
-        
-        # Stop replay
-        await mock_collector.stop()
-        collector_task.cancel()
+            print("📊 Replaying logged samples...")
+            
+            # Get replayed samples (lines written in one go once all have arrived)
+            lines = []
+            for i in range(5):
+                sample = await mock_collector.get_sample()
+                
+                lines.append(f"   Replay {i+1}: Solar={sample.solar_power:.0f}W, "
+                             f"Battery={sample.battery_soc:.1f}%, Status={sample.connection_status}")
+            print('\n'.join(lines))
+            
+            # Stop replay
+            await mock_collector.stop()
         
         print("✅ Replay demo complete\n")
         
@@ -301,19 +381,21 @@ async def demo_stub_scenarios():
         stub_collector = StubTelemetryCollector(scenario, sample_rate=5.0)
         await stub_collector.start()
         
-        # Start collector task
-        collector_task = asyncio.create_task(stub_collector.run_collector())
-        
-        # Get samples from scenario
-        for i in range(3):
-            sample = await stub_collector.get_sample()
+        # Collector task runs until stop() ends its loop; the group waits for it
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(stub_collector.run_collector())
             
-            print(f"   Step {i+1}: Solar={sample.solar_power:.0f}W, "
-                  f"Battery={sample.battery_soc:.1f}%, Grid={sample.grid_power:.0f}W")
-        
-        # Stop scenario
-        await stub_collector.stop()
-        collector_task.cancel()
+            # Get samples from scenario (lines written in one go once all have arrived)
+            lines = []
+            for i in range(3):
+                sample = await stub_collector.get_sample()
+                
+                lines.append(f"   Step {i+1}: Solar={sample.solar_power:.0f}W, "
+                             f"Battery={sample.battery_soc:.1f}%, Grid={sample.grid_power:.0f}W")
+            print('\n'.join(lines))
+            
+            # Stop scenario
+            await stub_collector.stop()
     
     print("\n✅ Stub scenarios demo complete\n")
 
@@ -327,26 +409,25 @@ async def demo_queue_analytics():
     stub_collector = StubTelemetryCollector("normal", sample_rate=2.0)
     await stub_collector.start()
     
-    # Start collector task
-    collector_task = asyncio.create_task(stub_collector.run_collector())
-    
-    # Analytics consumer that processes batches
-    samples_batch = await stub_collector.get_samples_batch(max_samples=10)
+    # Collector task runs until stop() ends its loop; the group waits for it
+    async with asyncio.TaskGroup() as tasks:
+        tasks.create_task(stub_collector.run_collector())
+        
+        # Analytics consumer that processes batches
+        samples_batch = await stub_collector.get_samples_batch(max_samples=10)
+        
+        # Stop analytics
+        await stub_collector.stop()
     
-    # Calculate analytics
-    solar_powers = [s.solar_power for s in samples_batch]
-    battery_socs = [s.battery_soc for s in samples_batch]
+    # Calculate analytics on per-field columns, transposed from the samples in one pass
+    solar_powers, battery_socs = zip(*map(attrgetter('solar_power', 'battery_soc'), samples_batch))
     
-    print(f"📊 Batch Analytics ({len(samples_batch)} samples):")
-    print(f"   Solar Power: avg={sum(solar_powers)/len(solar_powers):.0f}W, "
-          f"max={max(solar_powers):.0f}W, min={min(solar_powers):.0f}W")
-    print(f"   Battery SOC: avg={sum(battery_socs)/len(battery_socs):.1f}%, "
+    print(f"📊 Batch Analytics ({len(samples_batch)} samples):\n"
+          f"   Solar Power: avg={sum(solar_powers)/len(solar_powers):.0f}W, "
+          f"max={max(solar_powers):.0f}W, min={min(solar_powers):.0f}W\n"
+          f"   Battery SOC: avg={sum(battery_socs)/len(battery_socs):.1f}%, "
           f"max={max(battery_socs):.1f}%, min={min(battery_socs):.1f}%")
     
-    # Stop analytics
-    await stub_collector.stop()
-    collector_task.cancel()
-    
     print("✅ Analytics demo complete\n")
 
 
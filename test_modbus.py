@@ -26,6 +26,9 @@ def test_individual_registers():
     print("🔍 Testing basic registers:")
     print("=" * 50)
     
+    # One coalesced read for all of them instead of a request per register
+    values = client.read_multiple_registers(list(basic_registers))
+    
     for reg_name, description in basic_registers.items():
         print(f"\n📊 Testing {reg_name}:")
         print(f"   Description: {description}")
@@ -35,7 +38,7 @@ def test_individual_registers():
         print(f"   Data type: {reg_info['data_type']}")
         print(f"   Scale: {reg_info['scale']}")
         
-        value = client.read_register(reg_name)
+        value = values.get(reg_name)
         if value is not None:
             print(f"   ✅ Value: {value} {reg_info['unit']}")
         else:
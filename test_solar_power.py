@@ -4,19 +4,26 @@ Simple test to verify solar power reading from Sungrow inverter.
 Based on the Home Assistant configuration that works.
 """
 
+from typing import Optional
 from modbus_client import SungrowModbusClient
+import struct
 import time
 
 
-def test_solar_power():
-    """Test reading solar power with the exact HA configuration."""
+def test_solar_power(client: Optional[SungrowModbusClient] = None):
+    """
+    Test reading solar power with the exact HA configuration.
+    Pass a connected client to reuse its connection; otherwise one is opened and closed here.
+    """
     print("🌞 Testing Solar Power Reading")
     print("=" * 50)
     
-    client = SungrowModbusClient()
+    own_client = client is None
+    if own_client:
+        client = SungrowModbusClient()
     
     try:
-        if client.connect():
+        if not own_client or client.connect():
             print("✅ Connected to Sungrow inverter")
             
             # Test the solar power register specifically
@@ -47,8 +54,11 @@ def test_solar_power():
                 'running_state'
             ]
             
+            # One coalesced read for all of them instead of a request per register
+            values = client.read_multiple_registers(test_registers)
+            
             for reg_name in test_registers:
-                value = client.read_register(reg_name)
+                value = values.get(reg_name)
                 if value is not None:
                     reg_info = client.get_register_info(reg_name)
                     unit = reg_info.get('unit', '') if reg_info else ''
@@ -72,18 +82,24 @@ def test_solar_power():
         traceback.print_exc()
         
     finally:
-        client.disconnect()
+        if own_client:
+            client.disconnect()
 
 
-def test_raw_register_read():
-    """Test reading the raw register values for debugging."""
+def test_raw_register_read(client: Optional[SungrowModbusClient] = None):
+    """
+    Test reading the raw register values for debugging.
+    Pass a connected client to reuse its connection; otherwise one is opened and closed here.
+    """
     print("\n🔧 Raw Register Debug")
     print("=" * 50)
     
-    client = SungrowModbusClient()
+    own_client = client is None
+    if own_client:
+        client = SungrowModbusClient()
     
     try:
-        if client.connect():
+        if not own_client or client.connect():
             print("✅ Connected for raw register test")
             
             # Read raw registers at address 5016-5017 (total_dc_power)
@@ -99,10 +115,10 @@ def test_raw_register_read():
                 print(f"  Raw register 5016: {reg1} (0x{reg1:04X})")
                 print(f"  Raw register 5017: {reg2} (0x{reg2:04X})")
                 
-                # Test different interpretations
-                big_endian = (reg1 << 16) | reg2
-                little_endian = (reg2 << 16) | reg1
-                word_swap = (reg2 << 16) | reg1  # Same as little endian for this case
+                # Test different interpretations (high word first vs. low word first)
+                big_endian, = struct.unpack('>I', struct.pack('>HH', reg1, reg2))
+                word_swap, = struct.unpack('<I', struct.pack('<HH', reg1, reg2))
+                little_endian = word_swap  # Same as word swap for this case
                 
                 print(f"\n  Interpretations:")
                 print(f"    Big endian: {big_endian} W")
@@ -121,9 +137,15 @@ def test_raw_register_read():
         print(f"❌ Raw test error: {e}")
         
     finally:
-        client.disconnect()
+        if own_client:
+            client.disconnect()
 
 
 if __name__ == "__main__":
-    test_solar_power()
-    test_raw_register_read() 
\ No newline at end of file
+    # One connection for both tests
+    with SungrowModbusClient() as client:
+        if client.connect():
+            test_solar_power(client)
+            test_raw_register_read(client)
+        else:
+            print("❌ Failed to connect to inverter") 
\ No newline at end of file
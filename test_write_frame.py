@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression tests for monitor.write_frame() diffed redraws.
+Runs under pytest or standalone; the TTY and terminal size are stubbed.
+"""
+
+import io
+import os
+from unittest import mock
+
+import monitor
+
+
+class FakeTTY(io.StringIO):
+    """StringIO that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+def _draw(frames, columns, lines=40):
+    """Write each frame to a fresh stubbed TTY and return what each write produced."""
+    monitor._previous_frame.update(lines=None, size=None)
+    outputs = []
+    with mock.patch.object(monitor.shutil, 'get_terminal_size',
+                           return_value=os.terminal_size((columns, lines))):
+        for frame in frames:
+            tty = FakeTTY()
+            with mock.patch.object(monitor.sys, 'stdout', tty):
+                monitor.write_frame(frame)
+            outputs.append(tty.getvalue())
+    return outputs
+
+
+def _frame(value, width):
+    return "\n".join(["header", "│ " + "x" * width + " │", f"value: {value}", "footer"])
+
+
+def test_changed_line_is_diffed_when_frame_fits():
+    first, second = _draw([_frame(1, 40), _frame(2, 40)], columns=120)
+    assert first.startswith(monitor._CLEAR_SCREEN)
+    assert second == "\x1b[3;1Hvalue: 2\x1b[K\x1b[5;1H"
+
+
+def test_frame_wider_than_terminal_is_redrawn_in_full():
+    frames = [_frame(1, 118), _frame(2, 118)]
+    for output, frame in zip(_draw(frames, columns=80), frames):
+        assert output == monitor._CLEAR_SCREEN + frame + "\n"
+
+
+def test_line_exactly_terminal_wide_is_redrawn_in_full():
+    # "│ " + 76 x + " │" is 80 cells
+    _, second = _draw([_frame(1, 76), _frame(2, 76)], columns=80)
+    assert second.startswith(monitor._CLEAR_SCREEN)
+
+
+def test_double_width_characters_count_towards_wrapping():
+    frames = [f"🏠 {'⚡' * 40}\nvalue: {value}" for value in (1, 2)]
+    _, second = _draw(frames, columns=80)
+    assert second.startswith(monitor._CLEAR_SCREEN)
+
+
+def test_frame_after_wrapped_frame_is_redrawn_in_full():
+    _, _, third = _draw([_frame(1, 40), _frame(2, 118), _frame(3, 40)], columns=80)
+    assert third.startswith(monitor._CLEAR_SCREEN)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
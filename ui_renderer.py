@@ -4,24 +4,59 @@ UI Renderer for Energy Management System
 Pure UI rendering functions that convert analysis snapshots to Rich components.
 """
 
-from typing import Union
-from datetime import datetime
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
 
-from rich.console import RenderableType
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.table import Table
 from rich.panel import Panel
-from rich.columns import Columns
 from rich.text import Text
-from rich.align import Align
 from rich.layout import Layout
-from rich.progress import Progress, BarColumn, TextColumn
-from rich.rule import Rule
 
 from analysis import AnalysisSnapshot, PowerStreamStats, EnergyBalance, EnergyRatios
 
 
+# Color steps per type hint: (thresholds on |watts|, colors for watts >= 0, colors for watts < 0).
+# bisect_left counts thresholds strictly below |watts|, matching the original "> threshold" ladders.
+_POWER_COLORS = {
+    "solar": ((0, 1000, 5000), ("dim white", "dim yellow", "yellow", "bright_yellow"), ("dim white",) * 4),
+    "battery": ((0, 500), ("dim white", "green", "bright_green"), ("dim white", "red", "bright_red")),
+    "grid": ((0, 500), ("dim white", "cyan", "bright_cyan"), ("dim white", "magenta", "bright_magenta")),
+}
+_GENERIC_POWER_COLORS = ((1000,), ("white", "bright_white"), ("white", "bright_white"))
+
+# Power table rows: (label, color type hint, average style), in solar/battery/grid/load order
+_STREAM_ROWS = (
+    ("☀️ Solar", "solar", "dim yellow"),
+    ("🔋 Battery", "battery", "dim green"),
+    ("🏭 Grid", "grid", "dim cyan"),
+    ("🏠 Load", "generic", "dim white"),
+)
+
+_TREND_COLORS = ("red", "dim white", "green")  # indexed by sign + 1
+_STABILITY_THRESHOLDS, _STABILITY_COLORS = (0.1, 0.2), ("green", "yellow", "red")
+
+# Efficiency rows: (label, thresholds, (color, status) per level from lowest, description)
+_EFFICIENCY_ROWS = (
+    ("🎯 Self-Consumption", (0.6, 0.8),
+     (("yellow", "Moderate"), ("green", "Good"), ("bright_green", "Excellent")), "Solar energy used locally"),
+    ("☀️ Solar Coverage", (0.8, 1.0),
+     (("dim yellow", "Partial"), ("yellow", "High"), ("bright_yellow", "Excess")), "Load covered by solar"),
+    ("🔋 Battery Utilization", (0.1, 0.3),
+     (("dim blue", "Low"), ("blue", "Active"), ("bright_blue", "High")), "Battery activity vs solar"),
+    ("🏭 Grid Dependency", (0.2, 0.5),
+     (("green", "Low"), ("yellow", "Moderate"), ("red", "High")), "Load reliance on grid"),
+)
+
+_QUALITY_THRESHOLDS, _QUALITY_COLORS = (0.7, 0.9), ("yellow", "green", "bright_green")
+
+# Below this terminal size the full layout is mostly clipped, so only banner + efficiency are shown
+_FULL_LAYOUT_MIN_WIDTH, _FULL_LAYOUT_MIN_HEIGHT = 100, 30
+
+
+@lru_cache(maxsize=256)
 def _format_power(watts: float) -> str:
-    """Format power values with appropriate units and colors."""
+    """Format power values with appropriate units (memoised, readings repeat across frames)."""
     if abs(watts) >= 1_000_000:
         return f"{watts/1_000_000:.2f} MW"
     elif abs(watts) >= 1000:
@@ -30,6 +65,7 @@ def _format_power(watts: float) -> str:
         return f"{watts:.0f} W"
 
 
+@lru_cache(maxsize=256)
 def _format_percentage(ratio: float) -> str:
     """Format ratio as percentage."""
     return f"{ratio * 100:.1f}%"
@@ -37,26 +73,18 @@ def _format_percentage(ratio: float) -> str:
 
 def _get_power_color(watts: float, type_hint: str = "generic") -> str:
     """Get color for power values based on magnitude and type."""
-    if type_hint == "solar":
-        if watts > 5000: return "bright_yellow"
-        elif watts > 1000: return "yellow"
-        elif watts > 0: return "dim yellow"
-        else: return "dim white"
-    elif type_hint == "battery":
-        if watts > 500: return "bright_green"  # Heavy charging
-        elif watts > 0: return "green"  # Charging
-        elif watts < -500: return "bright_red"  # Heavy discharging
-        elif watts < 0: return "red"  # Discharging
-        else: return "dim white"  # Idle
-    elif type_hint == "grid":
-        if watts > 500: return "bright_cyan"  # Heavy export
-        elif watts > 0: return "cyan"  # Export
-        elif watts < -500: return "bright_magenta"  # Heavy import
-        elif watts < 0: return "magenta"  # Import
-        else: return "dim white"  # Balanced
-    else:
-        if abs(watts) > 1000: return "bright_white"
-        else: return "white"
+    thresholds, positive, negative = _POWER_COLORS.get(type_hint, _GENERIC_POWER_COLORS)
+    return (negative if watts < 0 else positive)[bisect_left(thresholds, abs(watts))]
+
+
+def _trend_color(derivative: float) -> str:
+    """Green when rising, red when falling, dim when flat."""
+    return _TREND_COLORS[(derivative > 0) - (derivative < 0) + 1]
+
+
+def _stability_color(oscillation_index: float) -> str:
+    """Green up to 0.1, yellow up to 0.2, red above."""
+    return _STABILITY_COLORS[bisect_left(_STABILITY_THRESHOLDS, oscillation_index)]
 
 
 def _render_power_stream_table(solar: PowerStreamStats, battery: PowerStreamStats,
@@ -71,45 +99,15 @@ def _render_power_stream_table(solar: PowerStreamStats, battery: PowerStreamStat
     table.add_column("Trend", justify="right", width=12)
     table.add_column("Stability", justify="right", width=10)
     
-    # Solar row
-    solar_current = Text(_format_power(solar.current), style=_get_power_color(solar.current, "solar"))
-    solar_avg = Text(_format_power(solar.mean), style="dim yellow")
-    solar_range = Text(f"{_format_power(solar.min_value)} to {_format_power(solar.max_value)}", style="dim white")
-    solar_trend = Text(f"{solar.first_derivative:+.1f} W/s", 
-                      style="green" if solar.first_derivative > 0 else "red" if solar.first_derivative < 0 else "dim white")
-    solar_stability = Text(f"{solar.oscillation_index:.3f}", 
-                          style="red" if solar.oscillation_index > 0.2 else "yellow" if solar.oscillation_index > 0.1 else "green")
-    table.add_row("☀️ Solar", solar_current, solar_avg, solar_range, solar_trend, solar_stability)
-    
-    # Battery row
-    battery_current = Text(_format_power(battery.current), style=_get_power_color(battery.current, "battery"))
-    battery_avg = Text(_format_power(battery.mean), style="dim green")
-    battery_range = Text(f"{_format_power(battery.min_value)} to {_format_power(battery.max_value)}", style="dim white")
-    battery_trend = Text(f"{battery.first_derivative:+.1f} W/s",
-                        style="green" if battery.first_derivative > 0 else "red" if battery.first_derivative < 0 else "dim white")
-    battery_stability = Text(f"{battery.oscillation_index:.3f}",
-                           style="red" if battery.oscillation_index > 0.2 else "yellow" if battery.oscillation_index > 0.1 else "green")
-    table.add_row("🔋 Battery", battery_current, battery_avg, battery_range, battery_trend, battery_stability)
-    
-    # Grid row
-    grid_current = Text(_format_power(grid.current), style=_get_power_color(grid.current, "grid"))
-    grid_avg = Text(_format_power(grid.mean), style="dim cyan")
-    grid_range = Text(f"{_format_power(grid.min_value)} to {_format_power(grid.max_value)}", style="dim white")
-    grid_trend = Text(f"{grid.first_derivative:+.1f} W/s",
-                     style="green" if grid.first_derivative > 0 else "red" if grid.first_derivative < 0 else "dim white")
-    grid_stability = Text(f"{grid.oscillation_index:.3f}",
-                         style="red" if grid.oscillation_index > 0.2 else "yellow" if grid.oscillation_index > 0.1 else "green")
-    table.add_row("🏭 Grid", grid_current, grid_avg, grid_range, grid_trend, grid_stability)
-    
-    # Load row
-    load_current = Text(_format_power(load.current), style=_get_power_color(load.current))
-    load_avg = Text(_format_power(load.mean), style="dim white")
-    load_range = Text(f"{_format_power(load.min_value)} to {_format_power(load.max_value)}", style="dim white")
-    load_trend = Text(f"{load.first_derivative:+.1f} W/s",
-                     style="green" if load.first_derivative > 0 else "red" if load.first_derivative < 0 else "dim white")
-    load_stability = Text(f"{load.oscillation_index:.3f}",
-                         style="red" if load.oscillation_index > 0.2 else "yellow" if load.oscillation_index > 0.1 else "green")
-    table.add_row("🏠 Load", load_current, load_avg, load_range, load_trend, load_stability)
+    for (label, type_hint, avg_style), stats in zip(_STREAM_ROWS, (solar, battery, grid, load)):
+        table.add_row(
+            label,
+            Text(_format_power(stats.current), style=_get_power_color(stats.current, type_hint)),
+            Text(_format_power(stats.mean), style=avg_style),
+            Text(f"{_format_power(stats.min_value)} to {_format_power(stats.max_value)}", style="dim white"),
+            Text(f"{stats.first_derivative:+.1f} W/s", style=_trend_color(stats.first_derivative)),
+            Text(f"{stats.oscillation_index:.3f}", style=_stability_color(stats.oscillation_index)),
+        )
     
     return table
 
@@ -122,24 +120,26 @@ def _render_energy_balance_panel(balance: EnergyBalance) -> Panel:
     equation_text.append("P_solar + P_grid = P_load + P_battery\n", style="bold bright_white")
     
     # Show actual values with colors
-    equation_text.append(f"{_format_power(balance.solar_power)}", style=_get_power_color(balance.solar_power, "solar"))
+    solar_power, grid_power = balance.solar_power, balance.grid_power
+    load_power, battery_power = balance.load_power, balance.battery_power
+    equation_text.append(_format_power(solar_power), style=_get_power_color(solar_power, "solar"))
     equation_text.append(" + ", style="dim white")
-    equation_text.append(f"{_format_power(balance.grid_power)}", style=_get_power_color(balance.grid_power, "grid"))
+    equation_text.append(_format_power(grid_power), style=_get_power_color(grid_power, "grid"))
     equation_text.append(" = ", style="bold white")
-    equation_text.append(f"{_format_power(balance.load_power)}", style="white")
+    equation_text.append(_format_power(load_power), style="white")
     equation_text.append(" + ", style="dim white")
-    equation_text.append(f"{_format_power(balance.battery_power)}", style=_get_power_color(balance.battery_power, "battery"))
+    equation_text.append(_format_power(battery_power), style=_get_power_color(battery_power, "battery"))
     
     # Show balance check
-    left_side = balance.solar_power + balance.grid_power
-    right_side = balance.load_power + balance.battery_power
+    left_side = solar_power + grid_power
+    right_side = load_power + battery_power
     equation_text.append(f"\n{_format_power(left_side)} = {_format_power(right_side)}", style="dim white")
     
     # Balance error
     equation_text.append(f"\nBalance Error: ", style="dim white")
-    error_color = "green" if balance.balance_valid else "red"
-    equation_text.append(f"{_format_power(balance.balance_error)}", style=error_color)
-    equation_text.append(" ✅" if balance.balance_valid else " ❌", style=error_color)
+    valid_mark, valid_color = (" ✅", "green") if balance.balance_valid else (" ❌", "red")
+    equation_text.append(_format_power(balance.balance_error), style=valid_color)
+    equation_text.append(valid_mark, style=valid_color)
     
     # Energy flow status
     equation_text.append("\n\nEnergy Flow Status:\n", style="bold dim white")
@@ -160,10 +160,7 @@ def _render_energy_balance_panel(balance: EnergyBalance) -> Panel:
     else:
         equation_text.append("🔋⏸️ Battery Idle", style="dim white")
     
-    panel_title = "⚖️ Energy Balance" + (" ✅" if balance.balance_valid else " ❌")
-    panel_style = "green" if balance.balance_valid else "red"
-    
-    return Panel(equation_text, title=panel_title, border_style=panel_style)
+    return Panel(equation_text, title="⚖️ Energy Balance" + valid_mark, border_style=valid_color)
 
 
 def _render_efficiency_metrics_table(ratios: EnergyRatios) -> Table:
@@ -175,45 +172,16 @@ def _render_efficiency_metrics_table(ratios: EnergyRatios) -> Table:
     table.add_column("Status", width=15)
     table.add_column("Description", width=30)
     
-    # Self-consumption ratio
-    sc_color = "bright_green" if ratios.self_consumption_ratio > 0.8 else "green" if ratios.self_consumption_ratio > 0.6 else "yellow"
-    sc_status = "Excellent" if ratios.self_consumption_ratio > 0.8 else "Good" if ratios.self_consumption_ratio > 0.6 else "Moderate"
-    table.add_row(
-        "🎯 Self-Consumption",
-        Text(_format_percentage(ratios.self_consumption_ratio), style=sc_color),
-        Text(sc_status, style=sc_color),
-        "Solar energy used locally"
-    )
-    
-    # Solar coverage ratio
-    coverage_color = "bright_yellow" if ratios.solar_coverage_ratio > 1.0 else "yellow" if ratios.solar_coverage_ratio > 0.8 else "dim yellow"
-    coverage_status = "Excess" if ratios.solar_coverage_ratio > 1.0 else "High" if ratios.solar_coverage_ratio > 0.8 else "Partial"
-    table.add_row(
-        "☀️ Solar Coverage",
-        Text(_format_percentage(ratios.solar_coverage_ratio), style=coverage_color),
-        Text(coverage_status, style=coverage_color),
-        "Load covered by solar"
-    )
-    
-    # Battery utilization
-    batt_color = "bright_blue" if ratios.battery_utilization_ratio > 0.3 else "blue" if ratios.battery_utilization_ratio > 0.1 else "dim blue"
-    batt_status = "High" if ratios.battery_utilization_ratio > 0.3 else "Active" if ratios.battery_utilization_ratio > 0.1 else "Low"
-    table.add_row(
-        "🔋 Battery Utilization",
-        Text(_format_percentage(ratios.battery_utilization_ratio), style=batt_color),
-        Text(batt_status, style=batt_color),
-        "Battery activity vs solar"
-    )
-    
-    # Grid dependency
-    grid_dep_color = "red" if ratios.grid_dependency_ratio > 0.5 else "yellow" if ratios.grid_dependency_ratio > 0.2 else "green"
-    grid_dep_status = "High" if ratios.grid_dependency_ratio > 0.5 else "Moderate" if ratios.grid_dependency_ratio > 0.2 else "Low"
-    table.add_row(
-        "🏭 Grid Dependency",
-        Text(_format_percentage(ratios.grid_dependency_ratio), style=grid_dep_color),
-        Text(grid_dep_status, style=grid_dep_color),
-        "Load reliance on grid"
-    )
+    values = (ratios.self_consumption_ratio, ratios.solar_coverage_ratio,
+              ratios.battery_utilization_ratio, ratios.grid_dependency_ratio)
+    for (label, thresholds, levels, description), ratio in zip(_EFFICIENCY_ROWS, values):
+        color, status = levels[bisect_left(thresholds, ratio)]
+        table.add_row(
+            label,
+            Text(_format_percentage(ratio), style=color),
+            Text(status, style=color),
+            description
+        )
     
     return table
 
@@ -240,11 +208,11 @@ def _render_system_status_banner(snapshot: AnalysisSnapshot) -> Panel:
     banner_text = Text()
     banner_text.append(f"🏠 ENERGY MANAGEMENT SYSTEM\n", style="bold bright_white")
     banner_text.append(f"Mode: {primary_mode}\n", style="bold bright_cyan")
-    banner_text.append(f"Timestamp: {snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n", style="dim white")
+    banner_text.append(f"Timestamp: {snapshot.timestamp.isoformat(' ', 'seconds')}\n", style="dim white")
     
     # System health indicators
-    quality_color = "bright_green" if snapshot.data_quality_score > 0.9 else "green" if snapshot.data_quality_score > 0.7 else "yellow"
-    stability_color = "green" if snapshot.system_stability_index < 0.1 else "yellow" if snapshot.system_stability_index < 0.2 else "red"
+    quality_color = _QUALITY_COLORS[bisect_left(_QUALITY_THRESHOLDS, snapshot.data_quality_score)]
+    stability_color = _STABILITY_COLORS[bisect_right(_STABILITY_THRESHOLDS, snapshot.system_stability_index)]
     
     banner_text.append(f"Data Quality: ", style="dim white")
     banner_text.append(f"{_format_percentage(snapshot.data_quality_score)}", style=quality_color)
@@ -269,6 +237,22 @@ def _render_snapshot_metadata(snapshot: AnalysisSnapshot) -> Table:
     return table
 
 
+class _Dashboard:
+    """Full layout, or a compact banner + efficiency view when the console is too small."""
+    
+    def __init__(self, full: Layout, compact: RenderableType):
+        self.full = full
+        self.compact = compact
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        height = options.height or console.height
+        if options.max_width < _FULL_LAYOUT_MIN_WIDTH or height < _FULL_LAYOUT_MIN_HEIGHT:
+            yield self.compact
+        else:
+            yield self.full
+
+
+@lru_cache(maxsize=1)
 def render(snapshot: AnalysisSnapshot) -> RenderableType:
     """
     Convert analysis snapshot to Rich renderable components.
@@ -277,9 +261,11 @@ def render(snapshot: AnalysisSnapshot) -> RenderableType:
         snapshot: Complete analysis snapshot from pure analysis kernel
         
     Returns:
-        RenderableType: Rich layout ready for Live display
+        RenderableType: Rich layout ready for Live display (compact view on small consoles)
         
-    This function is pure - no side effects, no I/O, no globals.
+    This function is pure - no side effects, no I/O, no globals. Snapshots are
+    frozen, so the last layout is memoised: Live repaints at 5fps while new
+    snapshots arrive at 2Hz, and a repeated snapshot skips the rebuild.
     """
     
     # Create main layout
@@ -292,7 +278,8 @@ def render(snapshot: AnalysisSnapshot) -> RenderableType:
     )
     
     # Header contains system status banner
-    layout["header"].update(_render_system_status_banner(snapshot))
+    banner = _render_system_status_banner(snapshot)
+    layout["header"].update(banner)
     
     # Body contains main content in columns
     layout["body"].split_row(
@@ -325,12 +312,11 @@ def render(snapshot: AnalysisSnapshot) -> RenderableType:
         Layout(name="metadata", ratio=1)
     )
     
-    layout["right"]["efficiency"].update(
-        _render_efficiency_metrics_table(snapshot.energy_ratios)
-    )
+    efficiency = _render_efficiency_metrics_table(snapshot.energy_ratios)
+    layout["right"]["efficiency"].update(efficiency)
     
     layout["right"]["metadata"].update(
         Panel(_render_snapshot_metadata(snapshot), title="📋 Analysis Info", border_style="dim white")
     )
     
-    return layout 
\ No newline at end of file
+    return _Dashboard(layout, Group(banner, efficiency)) 
\ No newline at end of file